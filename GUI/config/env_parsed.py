@@ -0,0 +1,24 @@
+"""Boolean environment flag parsing shared by the configuration modules."""
+import os
+from functools import lru_cache
+
+TRUE_VALUES = frozenset(('1', 'true', 'yes', 'on'))
+
+
+@lru_cache(maxsize=64)
+def _parse_bool(raw: str) -> bool:
+    """Parse a raw flag value; results are memoized per distinct string."""
+    return raw.strip().lower() in TRUE_VALUES
+
+
+def env_flag(name: str, default: bool = False) -> bool:
+    """Read a boolean flag from the environment.
+    
+    The environment is read on every call (the entry point overrides flags
+    such as DASH_DEBUG after import), but each distinct value is only
+    case-folded and compared once.
+    """
+    raw = os.environ.get(name)
+    if raw is None:
+        return default
+    return _parse_bool(raw)
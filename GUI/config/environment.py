@@ -6,23 +6,38 @@ import os
 import sys
 from pathlib import Path
 
-# Get the project root directory (GUI folder)
-# Use PYTHONPATH environment variable if available, otherwise use relative path
-if "PYTHONPATH" in os.environ:
-    PROJECT_ROOT = Path(os.environ["PYTHONPATH"])
-else:
-    PROJECT_ROOT = Path(__file__).parent.parent
+from config.settings import load_config
 
-SRC_DIR = PROJECT_ROOT / "src"
+# Get the project root directory (GUI folder)
+# Use PYTHONPATH environment variable if available, otherwise use relative path.
+# Plain os.path strings keep this import-time bootstrap free of Path parsing.
+_PROJECT_ROOT_STR = os.environ.get("PYTHONPATH") or os.path.dirname(
+    os.path.dirname(os.path.abspath(__file__))
+)
+_SRC_DIR_STR = os.path.join(_PROJECT_ROOT_STR, "src")
 
 # Set up Python path
-if str(SRC_DIR) not in sys.path:
-    sys.path.insert(0, str(SRC_DIR))
+if _SRC_DIR_STR not in sys.path:
+    sys.path.insert(0, _SRC_DIR_STR)
+
+PROJECT_ROOT = Path(_PROJECT_ROOT_STR)
+SRC_DIR = Path(_SRC_DIR_STR)
+
+# Centralized bytecode cache directory (only used outside containers)
+CACHE_DIR = PROJECT_ROOT / "__pycache__"
+IN_CONTAINER = Path("/.dockerenv").exists()
+_cache_dir_configured = False
+
+def setup_cache_dir():
+    """Point PYTHONPYCACHEPREFIX at CACHE_DIR once per process, keeping any explicit setting."""
+    global _cache_dir_configured
+    if _cache_dir_configured:
+        return
+    _cache_dir_configured = True
+    if not IN_CONTAINER:
+        os.environ.setdefault("PYTHONPYCACHEPREFIX", str(CACHE_DIR))
 
-# Configure centralized cache directory (only if not in container)
-if not Path("/.dockerenv").exists():
-    CACHE_DIR = PROJECT_ROOT / "__pycache__"
-    os.environ["PYTHONPYCACHEPREFIX"] = str(CACHE_DIR)
+setup_cache_dir()
 
 # Environment variables for the application
 ENVIRONMENT_DEFAULTS = {
@@ -36,11 +51,31 @@ ENVIRONMENT_DEFAULTS = {
     "APP_TITLE": "Cornell Hyperloop Sensor Dashboard"
 }
 
+# Per-environment overrides applied on top of ENVIRONMENT_DEFAULTS, selected by APP_ENV
+APP_ENV_DEFAULTS = {
+    "production": {},
+    "dev": {
+        "DASH_HOST": "127.0.0.1",
+        "DASH_DEBUG": "true"
+    }
+}
+
+APP_ENV = os.environ.get("APP_ENV", "production")
+_DEFAULTS = {**ENVIRONMENT_DEFAULTS, **APP_ENV_DEFAULTS.get(APP_ENV, {})}
+
+def _missing_defaults():
+    """Return the defaults for variables not already set in the environment."""
+    return {key: value for key, value in _DEFAULTS.items() if key not in os.environ}
+
+# Apply defaults once at import so later setup_environment() calls are a cheap re-check
+os.environ.update(_missing_defaults())
+
 def setup_environment():
     """Set up environment variables with defaults."""
-    for key, default_value in ENVIRONMENT_DEFAULTS.items():
-        if key not in os.environ:
-            os.environ[key] = default_value
+    missing = _missing_defaults()
+    if missing:
+        os.environ.update(missing)
+    load_config.cache_clear()
 
 def get_project_root():
     """Get the project root directory."""
@@ -1,53 +1,99 @@
 """Logging configuration for the application."""
+import atexit
 import logging
+import logging.handlers
+import queue
 import sys
-import os
 from typing import Optional
 
+from config.env_parsed import env_flag
+
+_LEVELS = {
+    'DEBUG': logging.DEBUG,
+    'INFO': logging.INFO,
+    'WARNING': logging.WARNING,
+    'ERROR': logging.ERROR,
+    'CRITICAL': logging.CRITICAL
+}
+
+_DEFAULT_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+_DEFAULT_FORMATTER = logging.Formatter(_DEFAULT_FORMAT)
+
+# Queue handler installed by setup_logging, the listener draining it, and the
+# settings they were installed with
+_handler: Optional[logging.Handler] = None
+_listener: Optional[logging.handlers.QueueListener] = None
+_configured_with: Optional[tuple] = None
+
+
+def _stop_listener() -> None:
+    """Flush queued records and stop the background log writer."""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+
 
 def setup_logging(level: str = "INFO", format_string: Optional[str] = None) -> None:
     """Setup application logging configuration.
     
+    Repeated calls with the same settings are no-ops, so the application,
+    entry point and WSGI factory can all call this safely.
+    
     Args:
         level: Logging level (DEBUG, INFO, WARNING, ERROR, CRITICAL)
         format_string: Custom format string for log messages
     """
+    global _handler, _listener, _configured_with
+    
     # Check if detailed logging is enabled via environment variable
-    enable_detailed_logs = os.environ.get("ENABLE_DETAILED_LOGS", "false").lower() == "true"
+    enable_detailed_logs = env_flag("ENABLE_DETAILED_LOGS")
     
-    if format_string is None:
-        format_string = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    settings = (level.upper(), format_string, enable_detailed_logs)
+    if settings == _configured_with:
+        return
     
-    # If detailed logging is disabled, set most loggers to WARNING or higher
+    # If detailed logging is disabled, drop INFO and below for every logger in one call
     if not enable_detailed_logs:
         # Only show WARNING and ERROR messages by default
+        logging.disable(logging.INFO)
         log_level = logging.WARNING
     else:
         # Show all INFO and above when detailed logging is enabled
-        log_level = getattr(logging, level.upper())
+        logging.disable(logging.NOTSET)
+        log_level = _LEVELS[level.upper()]
+    
+    formatter = _DEFAULT_FORMATTER if format_string is None else logging.Formatter(format_string)
+    
+    # QueueHandler.prepare() merges the message arguments (and any traceback) on
+    # the calling thread; the final formatting and the stdout write happen on the
+    # listener thread. Replace our own handler rather than relying on basicConfig,
+    # which silently does nothing once the root logger has handlers.
+    root = logging.getLogger()
+    if _handler is not None:
+        root.removeHandler(_handler)
+    if _listener is None:
+        atexit.register(_stop_listener)
+    else:
+        _listener.stop()
+    
+    stream_handler = logging.StreamHandler(sys.stdout)
+    stream_handler.setFormatter(formatter)
+    log_queue = queue.SimpleQueue()
+    _listener = logging.handlers.QueueListener(log_queue, stream_handler)
+    _listener.start()
     
-    logging.basicConfig(
-        level=log_level,
-        format=format_string,
-        handlers=[
-            logging.StreamHandler(sys.stdout)
-        ]
-    )
+    _handler = logging.handlers.QueueHandler(log_queue)
+    root.addHandler(_handler)
+    root.setLevel(log_level)
     
     # Set specific loggers to appropriate levels
     logging.getLogger('dash').setLevel(logging.WARNING)
     logging.getLogger('werkzeug').setLevel(logging.WARNING)
     
-    # Application-specific loggers
-    if not enable_detailed_logs:
-        # Suppress INFO logs from application modules when detailed logging is off
-        logging.getLogger('services').setLevel(logging.WARNING)
-        logging.getLogger('ui.callbacks').setLevel(logging.WARNING)
-        logging.getLogger('core').setLevel(logging.WARNING)
-        logging.getLogger('sensors').setLevel(logging.WARNING)
-        logging.getLogger('utils').setLevel(logging.WARNING)
+    _configured_with = settings
 
 
 def get_logger(name: str) -> logging.Logger:
     """Get a logger instance for the given name."""
-    return logging.getLogger(name)
\ No newline at end of file
+    return logging.getLogger(name)
@@ -1,10 +1,16 @@
 """Application configuration settings."""
 import os
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Optional
 
+from config.env_parsed import env_flag
 
-@dataclass
+# Rolling window size for per-sensor history
+MAX_DATA_POINTS = 1000
+
+
+@dataclass(frozen=True)
 class CommunicationConfig:
     """Configuration for communication settings."""
     port: str = '127.0.0.1'
@@ -13,7 +19,7 @@ class CommunicationConfig:
     use_mock: bool = False
 
 
-@dataclass
+@dataclass(frozen=True)
 class ServerConfig:
     """Configuration for the Dash server."""
     host: str = '127.0.0.1'
@@ -21,7 +27,7 @@ class ServerConfig:
     debug: bool = False
 
 
-@dataclass
+@dataclass(frozen=True)
 class AppConfig:
     """Main application configuration."""
     communication: CommunicationConfig
@@ -30,19 +36,24 @@ class AppConfig:
     suppress_callback_exceptions: bool = True
 
 
+@lru_cache(maxsize=1)
 def load_config() -> AppConfig:
-    """Load configuration from environment variables with sensible defaults."""
+    """Load configuration from environment variables with sensible defaults.
+    
+    The result is cached; call ``load_config.cache_clear()`` after changing
+    the environment to pick up new values.
+    """
     communication_config = CommunicationConfig(
         port=os.environ.get('SERIAL_PORT', '127.0.0.1'),
         baudrate=int(os.environ.get('SERIAL_BAUDRATE', '115200')),
         timeout=int(os.environ.get('SERIAL_TIMEOUT', '100')),
-        use_mock=os.environ.get('USE_MOCK_COMMUNICATION', 'false').lower() == 'true'
+        use_mock=env_flag('USE_MOCK_COMMUNICATION')
     )
     
     server_config = ServerConfig(
         host=os.environ.get('DASH_HOST', '127.0.0.1'),
         port=int(os.environ.get('DASH_PORT', '8050')),
-        debug=os.environ.get('DASH_DEBUG', 'false').lower() == 'true'
+        debug=env_flag('DASH_DEBUG')
     )
     
     return AppConfig(
@@ -10,8 +10,7 @@ from typing import Optional
 from config.environment import setup_environment
 setup_environment()
 
-from core.application import HyperloopGUIApplication
-from config.settings import load_config
+from config.settings import AppConfig, load_config
 from config.log_config import setup_logging, get_logger
 
 logger = get_logger(__name__)
@@ -29,11 +28,13 @@ def run_application(debug=True, host="0.0.0.0", port=8050):
         os.environ["DASH_HOST"] = host
         os.environ["DASH_PORT"] = str(port)
         
-        # Load configuration
+        # Load configuration (drop any copy cached before the overrides)
+        load_config.cache_clear()
         config = load_config()
         logger.info(f"Configuration loaded: server={config.server.host}:{config.server.port}")
         
-        # Create and run application
+        # Create and run application (imports Dash and the UI stack on first use)
+        from core.application import HyperloopGUIApplication
         app = HyperloopGUIApplication(config)
         app.run()
         
@@ -52,7 +53,11 @@ def run_tests():
         setup_logging()
         logger.info("Running application tests")
         
-        import test_architecture
+        # Resolved through sys.modules, so repeated runs in one process do not re-import
+        from tests.test_architecture import test_imports
+        if not test_imports():
+            logger.error("Application tests failed")
+            sys.exit(1)
         logger.info("Tests completed successfully!")
         
     except Exception as e:
@@ -84,11 +89,16 @@ def main():
         )
 
 
-def create_app():
-    """Create the application instance for WSGI deployment."""
+def create_app(config: Optional[AppConfig] = None):
+    """Create the application instance for WSGI deployment.
+    
+    Args:
+        config: Already-loaded configuration; defaults to the cached load_config()
+    """
     try:
+        from core.application import HyperloopGUIApplication
         setup_logging()
-        config = load_config()
+        config = config or load_config()
         hyperloop_app = HyperloopGUIApplication(config)
         return hyperloop_app.app
     except Exception as e:
@@ -1,19 +1,22 @@
 """Main application class."""
-from dash import Dash
-import dash_bootstrap_components as dbc
-from typing import List, Optional
+from typing import TYPE_CHECKING, List, Optional
 
 from config.settings import AppConfig, load_config
 from config.log_config import setup_logging, get_logger
 from core.dependencies import container
 from core.exceptions import HyperloopGUIError, CommunicationError
-from services.tcp_communication_service import CommunicationService
-from services.sensor_service import SensorService
-# from services.profile_service import ProfileService
-from ui.layout import MainLayout
+
+# Dash, the UI layout and the services are imported where they are first needed
+if TYPE_CHECKING:
+    from dash import Dash
 
 logger = get_logger(__name__)
 
+# Stylesheets added after the Bootstrap theme (Font Awesome for icons)
+EXTRA_STYLESHEETS = (
+    "https://use.fontawesome.com/releases/v5.15.4/css/all.css",
+)
+
 
 class HyperloopGUIApplication:
     """Main application class that orchestrates the entire GUI application."""
@@ -23,7 +26,7 @@ class HyperloopGUIApplication:
         self.config = config or load_config()
         self._setup_logging()
         self._setup_dependencies()
-        self._app: Optional[Dash] = None
+        self._app: Optional['Dash'] = None
         logger.info("Hyperloop GUI Application initialized")
     
     def _setup_logging(self) -> None:
@@ -34,6 +37,10 @@ class HyperloopGUIApplication:
     def _setup_dependencies(self) -> None:
         """Setup dependency injection container."""
         try:
+            from services.tcp_communication_service import CommunicationService
+            from services.sensor_service import SensorService
+            from services.profile_service import ProfileService
+            
             # Register configuration
             container.register(AppConfig, self.config)
             
@@ -44,8 +51,7 @@ class HyperloopGUIApplication:
             sensor_service = SensorService(communication_service)
             container.register(SensorService, sensor_service)
             
-            # Import and register ProfileService for VFD operational modes
-            from services.profile_service import ProfileService
+            # Register ProfileService for VFD operational modes
             profile_service = ProfileService(communication_service)
             container.register(ProfileService, profile_service)
             
@@ -55,21 +61,19 @@ class HyperloopGUIApplication:
             logger.error(f"Failed to setup dependencies: {e}")
             raise HyperloopGUIError(f"Dependency setup failed: {e}")
     
-    def create_app(self) -> Dash:
+    def create_app(self) -> 'Dash':
         """Create and configure the Dash application."""
         if self._app is not None:
             return self._app
         
         try:
-            # Include Font Awesome for icons
-            external_stylesheets = [
-                dbc.themes.BOOTSTRAP,
-                "https://use.fontawesome.com/releases/v5.15.4/css/all.css"
-            ]
+            from dash import Dash
+            import dash_bootstrap_components as dbc
+            from ui.layout import MainLayout
             
             self._app = Dash(
                 __name__,
-                external_stylesheets=external_stylesheets,
+                external_stylesheets=[dbc.themes.BOOTSTRAP, *EXTRA_STYLESHEETS],
                 suppress_callback_exceptions=self.config.suppress_callback_exceptions,
                 title=self.config.title,
                 assets_folder='assets'
@@ -109,6 +113,9 @@ class HyperloopGUIApplication:
     def shutdown(self) -> None:
         """Shutdown the application and cleanup resources."""
         try:
+            from services.tcp_communication_service import CommunicationService
+            from services.sensor_service import SensorService
+            
             # Cleanup services
             if container.has(CommunicationService):
                 communication_service = container.get(CommunicationService)
@@ -124,7 +131,7 @@ class HyperloopGUIApplication:
             logger.error(f"Error during shutdown: {e}")
     
     @property
-    def app(self) -> Dash:
+    def app(self) -> 'Dash':
         """Get the Dash application instance."""
         if self._app is None:
             self._app = self.create_app()
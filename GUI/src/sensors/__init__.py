@@ -1,19 +1,45 @@
 # sensors/__init__.py
 """Sensors package for the Hyperloop GUI application."""
-import os
-import importlib
-from typing import List, Type
-from .base_sensor import BaseSensor
-from services.tcp_communication_service import CommunicationService
+from functools import lru_cache
+from typing import TYPE_CHECKING, List, Tuple, Type
 import sys
 from pathlib import Path
 # Use PYTHONPATH for imports
 from config.log_config import get_logger
 
+if TYPE_CHECKING:
+    from .base_sensor import BaseSensor
+    from services.tcp_communication_service import CommunicationService
+
 logger = get_logger(__name__)
 
 
-def load_sensors(communication_service: CommunicationService) -> List[BaseSensor]:
+def __getattr__(name: str):
+    # BaseSensor pulls in NumPy, pandas and the TCP service; importing a
+    # submodule such as sensors.sensor_registry should not pay for that
+    if name == 'BaseSensor':
+        from .base_sensor import BaseSensor
+        return BaseSensor
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+@lru_cache(maxsize=1)
+def _load_sensor_types() -> Tuple[Type['BaseSensor'], ...]:
+    """Resolve the static sensor table once; later calls reuse the result."""
+    from .base_sensor import BaseSensor
+    from ._manifest import SENSOR_CLASSES
+    
+    sensor_types = []
+    for sensor_class in SENSOR_CLASSES:
+        if issubclass(sensor_class, BaseSensor):
+            sensor_types.append(sensor_class)
+        else:
+            logger.warning(f"No valid Sensor class found in {sensor_class.__module__}")
+    
+    return tuple(sensor_types)
+
+
+def load_sensors(communication_service: 'CommunicationService') -> List['BaseSensor']:
     """Load all available sensor implementations.
     
     Args:
@@ -23,57 +49,23 @@ def load_sensors(communication_service: CommunicationService) -> List[BaseSensor
         List of initialized sensor instances
     """
     sensors = []
-    sensor_folder = os.path.dirname(__file__)
     
-    try:
-        for filename in os.listdir(sensor_folder):
-            if filename.endswith('_sensor.py') and filename != 'base_sensor.py':
-                try:
-                    module_name = f'sensors.{filename[:-3]}'
-                    module = importlib.import_module(module_name)
-                    sensor_class = getattr(module, 'Sensor', None)
-                    
-                    if sensor_class and issubclass(sensor_class, BaseSensor):
-                        sensor_instance = sensor_class(communication_service)
-                        sensors.append(sensor_instance)
-                        logger.debug(f"Loaded sensor: {sensor_instance.name}")
-                    else:
-                        logger.warning(f"No valid Sensor class found in {module_name}")
-                        
-                except Exception as e:
-                    logger.error(f"Failed to load sensor from {filename}: {e}")
-                    
-    except Exception as e:
-        logger.error(f"Error loading sensors from {sensor_folder}: {e}")
+    for sensor_class in _load_sensor_types():
+        try:
+            sensor_instance = sensor_class(communication_service)
+            sensors.append(sensor_instance)
+            logger.debug(f"Loaded sensor: {sensor_instance.name}")
+        except Exception as e:
+            logger.error(f"Failed to load sensor {sensor_class.__module__}: {e}")
     
     logger.info(f"Loaded {len(sensors)} sensors")
     return sensors
 
 
-def get_available_sensor_types() -> List[Type[BaseSensor]]:
+def get_available_sensor_types() -> List[Type['BaseSensor']]:
     """Get all available sensor types without instantiating them.
     
     Returns:
         List of sensor classes
     """
-    sensor_types = []
-    sensor_folder = os.path.dirname(__file__)
-    
-    try:
-        for filename in os.listdir(sensor_folder):
-            if filename.endswith('_sensor.py') and filename != 'base_sensor.py':
-                try:
-                    module_name = f'sensors.{filename[:-3]}'
-                    module = importlib.import_module(module_name)
-                    sensor_class = getattr(module, 'Sensor', None)
-                    
-                    if sensor_class and issubclass(sensor_class, BaseSensor):
-                        sensor_types.append(sensor_class)
-                        
-                except Exception as e:
-                    logger.error(f"Failed to load sensor type from {filename}: {e}")
-                    
-    except Exception as e:
-        logger.error(f"Error getting sensor types from {sensor_folder}: {e}")
-    
-    return sensor_types
+    return list(_load_sensor_types())
@@ -0,0 +1,33 @@
+"""Static table of the sensor implementations shipped with this package."""
+
+from .ultrasonic_sensor import Sensor as UltrasonicSensor
+from .vl6180x_sensor import Sensor as VL6180XSensor
+from .accelerometer_sensor import Sensor as AccelerometerSensor
+from .pressure_sensor import Sensor as PressureSensor
+from .temperature_sensor import Sensor as TemperatureSensor
+from .thermistor_sensor import Sensor as ThermistorSensor
+from .line_sensor import Sensor as LineSensor
+from .proximity_sensor import Sensor as ProximitySensor
+from .servo_sensor import Sensor as ServoSensor
+from .vibration_sensor import Sensor as VibrationSensor
+from .relay_sensor import Sensor as RelaySensor
+from .nrf24l01_sensor import Sensor as NRF24L01Sensor
+from .gps_sensor import Sensor as GPSSensor
+
+# Sensor classes in registry order. Add new sensors here with an explicit
+# import above; nothing is discovered or imported dynamically.
+SENSOR_CLASSES = (
+    UltrasonicSensor,
+    VL6180XSensor,
+    AccelerometerSensor,
+    PressureSensor,
+    TemperatureSensor,
+    ThermistorSensor,
+    LineSensor,
+    ProximitySensor,
+    ServoSensor,
+    VibrationSensor,
+    RelaySensor,
+    NRF24L01Sensor,
+    GPSSensor,
+)
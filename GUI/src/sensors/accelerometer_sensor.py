@@ -1,19 +1,13 @@
 from .base_sensor import BaseSensor
 from services.tcp_communication_service import CommunicationService
-from typing import List, Dict
 
 class Sensor(BaseSensor):
-    def __init__(self, communication_service: CommunicationService):
-        super().__init__(communication_service)
-    
-    def get_name(self) -> str:
-        return 'Accelerometer Sensor'
+    __slots__ = ()
     
-    def get_sensor_id(self) -> str:
-        return 'ACCEL_SENSOR'
+    NAME = 'Accelerometer Sensor'
+    SENSOR_ID = 'ACCEL_SENSOR'
+    DATA_FIELDS = ('x', 'y', 'z')
+    UNITS = {'x': 'm/s²', 'y': 'm/s²', 'z': 'm/s²'}
     
-    def get_data_fields(self) -> List[str]:
-        return ['x', 'y', 'z']
-    
-    def get_units(self) -> Dict[str, str]:
-        return {'x': 'm/s²', 'y': 'm/s²', 'z': 'm/s²'}
+    def __init__(self, communication_service: CommunicationService):
+        super().__init__(communication_service)
@@ -1,97 +1,287 @@
 # sensors/base_sensor.py
-from datetime import datetime
+import threading
+import time
+from collections import deque
+from datetime import datetime, timedelta
+import numpy as np
 import pandas as pd
-from abc import ABC, abstractmethod
-from typing import List, Dict, Any, Optional
+from abc import ABC
+from typing import List, Dict, Any, Optional, Tuple
 
 from services.tcp_communication_service import CommunicationService
-from utils.data_processing import clean_sensor_data, validate_sensor_data
+from utils.data_processing import clean_sensor_data, validate_sensor_data_vec, DEFAULT_MAX_AGE_SECONDS
 import sys
 from pathlib import Path
 # Use PYTHONPATH for imports
 from config.log_config import get_logger
+from config.settings import MAX_DATA_POINTS
 
 logger = get_logger(__name__)
 
+# Records the reader thread may queue before the oldest are dropped
+RX_QUEUE_SIZE = 8192
+
 
 class BaseSensor(ABC):
     """Abstract base class for all sensors."""
     
+    # Subclasses declare ``__slots__ = ()`` so instances stay dict-free
+    __slots__ = ('communication_service', 'name', 'sensor_id', 'data_fields',
+                 'units', '_time', '_columns', '_head', '_count', '_is_active',
+                 '_t0_mono', '_t0_wall', '_writes', '_df_cache', '_df_cache_key',
+                 '_rx_queue', '_column_arrays', '_lock', '_rx_dropped', '_rx_dropped_logged')
+    
+    # Sensor metadata, declared as class attributes by each subclass so the
+    # registry can read it without creating an instance; the get_* classmethods
+    # below expose the same values
+    NAME: str = ''
+    SENSOR_ID: str = ''
+    DATA_FIELDS: Tuple[str, ...] = ()
+    UNITS: Dict[str, str] = {}
+    
+    def __init_subclass__(cls, **kwargs):
+        """Reject sensor classes that do not declare their metadata."""
+        super().__init_subclass__(**kwargs)
+        missing = [attr for attr in ('NAME', 'SENSOR_ID', 'DATA_FIELDS', 'UNITS') if not getattr(cls, attr)]
+        if missing:
+            raise TypeError(f"Sensor class {cls.__qualname__} must declare {', '.join(missing)}")
+    
     def __init__(self, communication_service: CommunicationService):
         self.communication_service = communication_service
         self.name = self.get_name()
         self.sensor_id = self.get_sensor_id()
-        self.data_fields = self.get_data_fields()
+        # Resolved once per instance
+        self.data_fields = tuple(self.get_data_fields())
         self.units = self.get_units()
-        self.data: List[Dict[str, Any]] = []
+        # Column-per-field ring buffers; _head is the next write slot.
+        # Times are time.monotonic_ns() values, mapped to wall clock on read
+        # through the (_t0_mono, _t0_wall) anchor.
+        self._t0_mono = time.monotonic_ns()
+        self._t0_wall = datetime.now()
+        self._time = np.empty(MAX_DATA_POINTS, dtype=np.int64)
+        self._columns: Dict[str, np.ndarray] = {
+            field: np.empty(MAX_DATA_POINTS, dtype=np.float64) for field in self.data_fields
+        }
+        # Same arrays in data_fields order, so per-sample writes skip the name lookup
+        self._column_arrays = tuple(self._columns.values())
+        self._head = 0
+        self._count = 0
+        # get_data() result, reused until _writes moves past _df_cache_key
+        self._writes = 0
+        self._df_cache: Optional[pd.DataFrame] = None
+        self._df_cache_key = -1
+        # Hand-off from the reader thread, which only appends (deque.append is
+        # atomic). Dash may read from several request threads at once, so
+        # draining into the rings and reading them back happen under _lock.
+        self._rx_queue = deque(maxlen=RX_QUEUE_SIZE)
+        self._lock = threading.Lock()
+        # Records evicted from a full _rx_queue; only the reader thread increments
+        # _rx_dropped, and _drain reports anything past _rx_dropped_logged
+        self._rx_dropped = 0
+        self._rx_dropped_logged = 0
         self._is_active = False
         self._register_callback()
-        logger.debug(f"Initialized sensor: {self.name}")
+        logger.debug("Initialized sensor: %s", self.name)
     
-    @abstractmethod
-    def get_name(self) -> str:
+    @classmethod
+    def get_name(cls) -> str:
         """Get the sensor name."""
-        pass
+        return cls.NAME
     
-    @abstractmethod
-    def get_sensor_id(self) -> str:
+    @classmethod
+    def get_sensor_id(cls) -> str:
         """Get the sensor ID for communication."""
-        pass
+        return cls.SENSOR_ID
     
-    @abstractmethod
-    def get_data_fields(self) -> List[str]:
+    @classmethod
+    def get_data_fields(cls) -> List[str]:
         """Get the list of data field names."""
-        pass
+        return list(cls.DATA_FIELDS)
     
-    def get_units(self) -> Dict[str, str]:
-        """Get units for each data field. Override in subclasses."""
-        return {field: "" for field in self.data_fields}
+    @classmethod
+    def get_units(cls) -> Dict[str, str]:
+        """Get units for each data field as a copy callers may modify."""
+        return dict(cls.UNITS)
     
     def _register_callback(self) -> None:
         """Register callback with communication service."""
         try:
-            self.communication_service.register_callback(
-                self.sensor_id, 
-                self.data_callback
-            )
+            # Prefer batched delivery when the transport supports it
+            register_batch = getattr(self.communication_service, 'register_batch_callback', None)
+            if register_batch is not None:
+                register_batch(self.sensor_id, self.data_callback_batch)
+            else:
+                self.communication_service.register_callback(
+                    self.sensor_id, 
+                    self.data_callback
+                )
             self._is_active = True
-            logger.debug(f"Registered callback for sensor {self.name}")
+            logger.debug("Registered callback for sensor %s", self.name)
         except Exception as e:
             logger.error(f"Failed to register callback for sensor {self.name}: {e}")
             self._is_active = False
     
     def data_callback(self, values: List[str]) -> None:
-        """Handle incoming sensor data."""
+        """Queue incoming sensor data; it is parsed when the data is next read."""
+        queue = self._rx_queue
+        if len(queue) == RX_QUEUE_SIZE:
+            self._rx_dropped += 1
+        queue.append((time.monotonic_ns(), values))
+    
+    def data_callback_batch(self, batch: List[Tuple[int, bytes]]) -> None:
+        """Queue a batch of ``(monotonic_ns, payload)`` samples in one call."""
+        queue = self._rx_queue
+        if len(queue) == RX_QUEUE_SIZE:
+            self._rx_dropped += 1
+        queue.append((None, batch))
+    
+    def _drain(self) -> None:
+        """Ingest everything the reader thread has queued so far. Caller holds _lock."""
+        dropped = self._rx_dropped
+        if dropped != self._rx_dropped_logged:
+            logger.warning("Receive queue full for sensor %s: dropped %d queued records",
+                           self.name, dropped - self._rx_dropped_logged)
+            self._rx_dropped_logged = dropped
+        queue = self._rx_queue
+        while True:
+            try:
+                timestamp, payload = queue.popleft()
+            except IndexError:
+                return
+            if timestamp is None:
+                self._ingest_batch(payload)
+            else:
+                try:
+                    self._store_sample(timestamp, payload)
+                except Exception as e:
+                    logger.error(f"Error processing data for sensor {self.name}: {e}")
+    
+    def _ingest_batch(self, batch: List[Tuple[int, bytes]]) -> None:
+        """Parse a queued batch with a single NumPy call and write it into the rings by slice."""
         try:
-            # Create data dictionary
-            data_dict = {'Time': datetime.now()}
+            field_count = len(self.data_fields)
+            # Rows missing fields would be dropped by clean_sensor_data anyway
+            rows = [(timestamp, payload) for timestamp, payload in batch
+                    if payload.count(b',') + 1 >= field_count]
+            rejected = len(batch) - len(rows)
+            if rejected:
+                logger.warning("Dropped %d of %d samples for %s with fewer than %d fields",
+                               rejected, len(batch), self.name, field_count)
+            if not rows:
+                return
             
-            # Parse values
-            for field_name, value_str in zip(self.data_fields, values):
-                try:
-                    data_dict[field_name] = float(value_str)
-                except (ValueError, TypeError) as e:
-                    logger.warning(f"Invalid value for {field_name} in {self.name}: {value_str}")
-                    data_dict[field_name] = 0.0
+            values = np.genfromtxt(
+                [payload for _, payload in rows],
+                delimiter=',',
+                dtype=np.float64,
+                usecols=range(field_count),
+                comments=None,
+                invalid_raise=False,
+            ).reshape(-1, field_count)
+            if len(values) != len(rows):
+                # genfromtxt skipped a line (e.g. an empty payload) so rows no longer
+                # line up with timestamps; store this batch sample by sample instead
+                self._store_rows(rows)
+                return
+            # Unparseable values come back as NaN; store them as 0.0 like data_callback
+            values[np.isnan(values)] = 0.0
+            times = np.fromiter((timestamp for timestamp, _ in rows), dtype=np.int64, count=len(rows))
             
-            # Validate data
-            if validate_sensor_data(data_dict):
-                self.data.append(data_dict)
-                # Keep only recent data (last 1000 points)
-                if len(self.data) > 1000:
-                    self.data = self.data[-1000:]
-                logger.debug(f"Added data point for sensor {self.name}")
-            else:
-                logger.warning(f"Invalid data structure for sensor {self.name}: {data_dict}")
-                
+            # Rows with infinite values would be dropped by clean_sensor_data; skip them here
+            valid = validate_sensor_data_vec(values)
+            if not valid.all():
+                times, values = times[valid], values[valid]
+            
+            self._store_block(times, values)
+            logger.debug("Added %d data points for sensor %s", len(times), self.name)
         except Exception as e:
-            logger.error(f"Error processing data for sensor {self.name}: {e}")
+            logger.error(f"Error processing data batch for sensor {self.name}: {e}")
+    
+    def _store_rows(self, rows: List[Tuple[int, bytes]]) -> None:
+        """Per-sample fallback for a batch the vectorised parser could not align."""
+        for timestamp, payload in rows:
+            try:
+                self._store_sample(timestamp, payload.split(b','))
+            except Exception as e:
+                logger.error(f"Error processing data for sensor {self.name}: {e}")
+    
+    def _store_block(self, times: np.ndarray, values: np.ndarray) -> None:
+        """Write consecutive samples into the ring buffers using at most two slices."""
+        count = len(times)
+        if count > MAX_DATA_POINTS:
+            times, values = times[-MAX_DATA_POINTS:], values[-MAX_DATA_POINTS:]
+            count = MAX_DATA_POINTS
+        
+        head = self._head
+        first = min(count, MAX_DATA_POINTS - head)
+        rest = count - first
+        self._time[head:head + first] = times[:first]
+        self._time[:rest] = times[first:]
+        for index, column in enumerate(self._column_arrays):
+            column[head:head + first] = values[:first, index]
+            column[:rest] = values[first:, index]
+        
+        self._head = (head + count) % MAX_DATA_POINTS
+        self._count = min(self._count + count, MAX_DATA_POINTS)
+        self._writes += count
+    
+    def _store_sample(self, timestamp: int, values: List[str]) -> None:
+        """Write one sample into the ring buffers."""
+        head = self._head
+        self._time[head] = timestamp
+        
+        # Parse values; fields missing from the payload are stored as NaN
+        # so clean_sensor_data drops the row, as it did for absent keys
+        columns = self._column_arrays
+        parsed = 0
+        for column, value_str in zip(columns, values):
+            try:
+                column[head] = float(value_str)
+            except (ValueError, TypeError):
+                logger.warning("Invalid value for %s in %s: %s", self.data_fields[parsed], self.name, value_str)
+                column[head] = 0.0
+            parsed += 1
+        for column in columns[parsed:]:
+            column[head] = np.nan
+        
+        self._head = (head + 1) % MAX_DATA_POINTS
+        if self._count < MAX_DATA_POINTS:
+            self._count += 1
+        self._writes += 1
+    
+    def _ordered_indices(self) -> np.ndarray:
+        """Ring-buffer slots holding data, oldest first."""
+        if self._count < MAX_DATA_POINTS:
+            return np.arange(self._count)
+        return np.roll(np.arange(MAX_DATA_POINTS), -self._head)
     
     def get_data(self) -> pd.DataFrame:
-        """Get sensor data as a pandas DataFrame."""
+        """Get sensor data as a pandas DataFrame.
+        
+        The frame is cached until new samples arrive or its oldest row ages out,
+        so callers must treat it as read-only.
+        """
         try:
-            df = pd.DataFrame(self.data)
-            return clean_sensor_data(df) if not df.empty else df
+            with self._lock:
+                self._drain()
+                if not self._count:
+                    return pd.DataFrame()
+                
+                cached = self._df_cache
+                if cached is not None and self._df_cache_key == self._writes:
+                    cutoff = datetime.now() - timedelta(seconds=DEFAULT_MAX_AGE_SECONDS)
+                    if cached.empty or cached['Time'].iat[0] >= cutoff:
+                        return cached
+                
+                order = self._ordered_indices()
+                elapsed = (self._time[order] - self._t0_mono).astype('timedelta64[ns]')
+                columns = {'Time': np.datetime64(self._t0_wall, 'ns') + elapsed}
+                for field_name, column in self._columns.items():
+                    columns[field_name] = column[order]
+                df = clean_sensor_data(pd.DataFrame(columns))
+                self._df_cache = df
+                self._df_cache_key = self._writes
+                return df
         except Exception as e:
             logger.error(f"Error getting data for sensor {self.name}: {e}")
             return pd.DataFrame()
@@ -99,19 +289,36 @@ class BaseSensor(ABC):
     def get_latest_data(self) -> Optional[Dict[str, Any]]:
         """Get the most recent data point."""
         try:
-            return self.data[-1] if self.data else None
+            with self._lock:
+                self._drain()
+                if not self._count:
+                    return None
+                last = (self._head - 1) % MAX_DATA_POINTS
+                latest = {'Time': self._slot_time(last)}
+                for field_name, column in self._columns.items():
+                    latest[field_name] = float(column[last])
+                return latest
         except Exception as e:
             logger.error(f"Error getting latest data for sensor {self.name}: {e}")
             return None
     
+    def _slot_time(self, slot: int) -> datetime:
+        """Wall-clock time of the sample stored in ``slot``."""
+        elapsed_ns = int(self._time[slot]) - self._t0_mono
+        return self._t0_wall + timedelta(microseconds=elapsed_ns // 1000)
+    
     def clear_data(self) -> None:
         """Clear all stored data."""
-        self.data.clear()
-        logger.debug(f"Cleared data for sensor {self.name}")
+        with self._lock:
+            self._rx_queue.clear()
+            self._head = 0
+            self._count = 0
+            self._df_cache = None
+        logger.debug("Cleared data for sensor %s", self.name)
     
     def is_active(self) -> bool:
         """Check if sensor is active and receiving data."""
-        return self._is_active and bool(self.data)
+        return self._is_active and (self._count > 0 or bool(self._rx_queue))
     
     def start(self) -> bool:
         """Start the sensor. Override in subclasses if needed."""
@@ -124,7 +331,7 @@ class BaseSensor(ABC):
         try:
             self.communication_service.deregister_callback(self.sensor_id)
             self._is_active = False
-            logger.debug(f"Stopped sensor {self.name}")
+            logger.debug("Stopped sensor %s", self.name)
             return True
         except Exception as e:
             logger.error(f"Error stopping sensor {self.name}: {e}")
@@ -134,17 +341,24 @@ class BaseSensor(ABC):
         """Close the sensor and cleanup resources."""
         self.stop()
         self.clear_data()
-        logger.debug(f"Closed sensor {self.name}")
+        logger.debug("Closed sensor %s", self.name)
     
     def get_status(self) -> Dict[str, Any]:
-        """Get sensor status information."""
-        latest_data = self.get_latest_data()
+        """Get sensor status information.
+        
+        Does not drain the receive queue, so the counts cover samples ingested
+        by the last read; queued samples still mark the sensor active.
+        """
+        with self._lock:
+            count = self._count
+            last_update = self._slot_time((self._head - 1) % MAX_DATA_POINTS) if count else None
         return {
             'name': self.name,
             'sensor_id': self.sensor_id,
-            'is_active': self.is_active(),
-            'data_points': len(self.data),
-            'last_update': latest_data['Time'] if latest_data else None,
+            'is_active': self._is_active and (count > 0 or bool(self._rx_queue)),
+            'data_points': count,
+            'dropped_records': self._rx_dropped,
+            'last_update': last_update,
             'data_fields': self.data_fields,
             'units': self.units
         }
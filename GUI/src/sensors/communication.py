@@ -1,16 +1,39 @@
 # sensors/communication.py
+import os
+import random
+import selectors
 import threading
 import time
+import logging
 from abc import ABC, abstractmethod
+from collections import defaultdict
+from dataclasses import dataclass
+from typing import Tuple
 import serial
 import sys
 from pathlib import Path
 
 # Use PYTHONPATH for imports
 from config.log_config import get_logger
+from utils.data_processing import HEADER_PATTERN, NUMBER_PATTERN
 
 logger = get_logger(__name__)
 
+# Seconds between batched callback flushes (25 Hz)
+BATCH_FLUSH_INTERVAL = 0.04
+
+# Longest wait for serial data before re-checking the running flag
+SELECT_TIMEOUT = 0.5
+READ_CHUNK_SIZE = 4096
+
+@dataclass(slots=True)
+class DiscoveredSensor:
+    """Bookkeeping for a sensor announced through a header line."""
+    pins: Tuple[str, ...]
+    last_seen: float  # time.monotonic() of the latest header
+    payload: str
+
+
 class CommunicationInterface(ABC):
     def __init__(self):
         self.callbacks = {}  # {sensor_id: callback}
@@ -31,21 +54,46 @@ class CommunicationInterface(ABC):
         pass
 
 class PySerialCommunication(CommunicationInterface):
+    """Serial reader that dispatches sensor lines to registered callbacks.
+
+    Only the read thread reads from ``serial_conn``, so reads are lock-free;
+    ``serial_lock`` guards closing and replacing the connection.
+    """
+
     def __init__(self, port, baudrate=9600, timeout=1, reconnect_interval=5):
         super().__init__()
+        self.batch_callbacks = {}  # {sensor_id: callback(list of (monotonic_ns, payload))}
         self.port = port
         self.baudrate = baudrate
         self.timeout = timeout
         self.reconnect_interval = reconnect_interval
         self.serial_conn = None
         self.running = True
+        self._stop_event = threading.Event()  # Set by close() to cut short any retry wait
         self.serial_lock = threading.Lock()
-        self.discovered_sensors = {}  # {sensor_name: {'pins': [], 'last_seen': timestamp}}
+        self.discovered_sensors = {}  # {sensor_name: DiscoveredSensor}
         self.sensor_discovery_callback = None  # Callback when new sensor discovered
+        self._pending = defaultdict(list)  # {sensor_id: [(monotonic_ns, payload), ...]}
+        self._last_flush = time.monotonic()
+        self._selector = selectors.DefaultSelector()
+        self._fd = None  # Descriptor registered with the selector, None to fall back to readline()
+        self._rxbuf = bytearray()
         self.thread = threading.Thread(target=self.read_loop, name="SerialReadThread")
         self.thread.daemon = True
         self.thread.start()
 
+    def register_batch_callback(self, sensor_id, callback):
+        """Register a callback that receives samples in batches of (monotonic_ns, payload).
+
+        The payload is the raw comma-separated value bytes, left undecoded and
+        unsplit so the receiver can parse a whole batch at once.
+        """
+        self.batch_callbacks[sensor_id] = callback
+
+    def deregister_callback(self, sensor_id):
+        super().deregister_callback(sensor_id)
+        self.batch_callbacks.pop(sensor_id, None)
+
     def connect(self):
         retry_count = 0
         max_retries = 3  # Limit retries to avoid endless loops
@@ -58,15 +106,16 @@ class PySerialCommunication(CommunicationInterface):
                     baudrate=self.baudrate,
                     timeout=self.timeout
                 )
-                time.sleep(2)  # Wait for Arduino to reset if necessary
+                self._stop_event.wait(2)  # Wait for Arduino to reset if necessary
+                self._watch_connection()
                 logger.info(f"[SUCCESS] Successfully connected to serial port {self.port}")
                 break  # Exit the loop once connected
             except serial.SerialException as e:
                 retry_count += 1
                 logger.warning(f"[ERROR] Error connecting to serial port {self.port}: {e}")
                 if retry_count < max_retries:
-                    logger.info(f"Retrying in {self.reconnect_interval} seconds... ({retry_count}/{max_retries})")
-                    time.sleep(self.reconnect_interval)
+                    if self._wait_before_retry(retry_count, max_retries):
+                        return
                 else:
                     logger.error(f"[ERROR] Failed to connect after {max_retries} attempts.")
                     logger.error(f"[ERROR] No microcontroller detected on port {self.port}")
@@ -76,34 +125,58 @@ class PySerialCommunication(CommunicationInterface):
                 retry_count += 1
                 logger.error(f"[ERROR] Unexpected error: {e}")
                 if retry_count < max_retries:
-                    logger.info(f"Retrying in {self.reconnect_interval} seconds... ({retry_count}/{max_retries})")
-                    time.sleep(self.reconnect_interval)
+                    if self._wait_before_retry(retry_count, max_retries):
+                        return
                 else:
                     logger.error(f"[ERROR] Failed to connect after {max_retries} attempts.")
                     logger.error(f"[ERROR] Hardware connection failed on port {self.port}")
                     self.serial_conn = None
                     break
 
+    def _wait_before_retry(self, retry_count, max_retries):
+        """Sleep with exponential backoff and jitter; return True if close() interrupted it."""
+        delay = min(0.5 * 2 ** retry_count, self.reconnect_interval) + random.random()
+        logger.info(f"Retrying in {delay:.1f} seconds... ({retry_count}/{max_retries})")
+        return self._stop_event.wait(delay)
+
     def read_loop(self):
         self.connect()
         
+        # Bind hot-path lookups once; the dicts are mutated in place, never rebound
+        callbacks = self.callbacks
+        batch_callbacks = self.batch_callbacks
+        pending = self._pending
+        read_lines = self._read_lines
+        parse_header = self.parse_header
+        parse_message = self.parse_message
+        now = time.monotonic_ns
+        monotonic = time.monotonic
+        
         while self.running:
             if self.serial_conn and self.serial_conn.is_open:
                 try:
-                    with self.serial_lock:
-                        line = self.serial_conn.readline().decode('utf-8').strip()
-                    if line:
-                        logger.debug(f"Received line: {line}")
+                    for raw_line in read_lines():
+                        # Lines stay bytes; only the sensor id and headers are decoded
+                        line = raw_line.strip()
+                        if not line:
+                            continue
+                        if logger.isEnabledFor(logging.DEBUG):
+                            logger.debug("Received line: %r", line)
                         
                         # Check if this is a header message
-                        if line.startswith('*H*_'):
-                            self.parse_header(line)
+                        if line.startswith(b'*H*_'):
+                            parse_header(line.decode('utf-8'))
                         else:
                             # Regular sensor data message
-                            sensor_id, data_str = self.parse_message(line)
-                            if sensor_id and sensor_id in self.callbacks:
-                                data_values = data_str.split(',')
-                                self.callbacks[sensor_id](data_values)
+                            sensor_id, data_bytes = parse_message(line)
+                            if sensor_id in batch_callbacks:
+                                pending[sensor_id].append((now(), data_bytes))
+                            elif sensor_id and sensor_id in callbacks:
+                                data_values = data_bytes.split(b',')
+                                callbacks[sensor_id](data_values)
+                    
+                    if pending and monotonic() - self._last_flush >= BATCH_FLUSH_INTERVAL:
+                        self._flush_pending()
                                 
                 except serial.SerialException as e:
                     logger.warning(f"SerialException occurred: {e}")
@@ -129,14 +202,63 @@ class PySerialCommunication(CommunicationInterface):
             else:
                 logger.debug("Serial connection is not open. Attempting to reconnect...")
                 self.connect()
-            time.sleep(0.01)  # Small delay for high-frequency updates
+
+    def _watch_connection(self):
+        """Register the open port with the selector so reads block until data arrives."""
+        if self._fd is not None:
+            try:
+                self._selector.unregister(self._fd)
+            except (KeyError, ValueError):
+                pass
+            self._fd = None
+        self._rxbuf.clear()
+        
+        try:
+            fd = self.serial_conn.fileno()
+            self._selector.register(fd, selectors.EVENT_READ)
+            self._fd = fd
+        except Exception as e:
+            # Ports without a selectable descriptor (e.g. on Windows) use readline()
+            logger.debug(f"Serial port {self.port} is not selectable, using readline(): {e}")
+
+    def _read_lines(self):
+        """Return the complete raw lines currently available from the port."""
+        if self._fd is None:
+            line = self.serial_conn.readline()
+            return [line] if line else []
+        
+        timeout = BATCH_FLUSH_INTERVAL if self._pending else SELECT_TIMEOUT
+        if not self._selector.select(timeout):
+            return []
+        chunk = os.read(self._fd, READ_CHUNK_SIZE)
+        if not chunk:
+            raise serial.SerialException("Serial device reported readiness but returned no data")
+        
+        self._rxbuf += chunk
+        *lines, remainder = self._rxbuf.split(b'\n')
+        self._rxbuf = bytearray(remainder)
+        return lines
+
+    def _flush_pending(self):
+        """Deliver queued samples to their batch callbacks in one call per sensor."""
+        # Snapshot and clear in place so read_loop's local binding stays valid
+        pending = tuple(self._pending.items())
+        self._pending.clear()
+        self._last_flush = time.monotonic()
+        for sensor_id, batch in pending:
+            callback = self.batch_callbacks.get(sensor_id)
+            if callback:
+                try:
+                    callback(batch)
+                except Exception as e:
+                    logger.error(f"Error in batch callback for {sensor_id}: {e}")
 
     def parse_message(self, message):
-        parts = message.split(':', 1)
-        if len(parts) == 2:
-            return parts[0].strip(), parts[1].strip()
-        else:
-            return None, None
+        """Split a raw ``b'sensor_id:v1,v2,...'`` line into (str id, bytes values)."""
+        sensor_id, sep, data_bytes = message.partition(b':')
+        if sep:
+            return sensor_id.strip().decode('utf-8', 'replace'), data_bytes.strip()
+        return None, None
     
     def parse_header(self, header_line):
         """Parse header format: *H*_sensorName_pinList_payload
@@ -144,46 +266,59 @@ class PySerialCommunication(CommunicationInterface):
         Example: *H*_accelerometer_A0,D3,D4_speed:5km/h
         """
         try:
-            # Remove *H*_ prefix
             if not header_line.startswith('*H*_'):
                 return
             
-            content = header_line[4:]  # Remove '*H*_'
-            parts = content.split('_', 2)  # Split into max 3 parts
-            
-            if len(parts) < 3:
+            match = HEADER_PATTERN.match(header_line)
+            if not match:
                 logger.warning(f"Invalid header format: {header_line}")
                 return
             
-            sensor_name = parts[0]
-            pin_list = parts[1].split(',') if parts[1] else []
-            payload = parts[2] if len(parts) > 2 else ""
+            sensor_name, pins_str, payload = match.groups()
+            pin_list = pins_str.split(',') if pins_str else []
             
             # Update discovered sensors
-            if sensor_name not in self.discovered_sensors:
+            record = self.discovered_sensors.get(sensor_name)
+            if record is None:
                 logger.info(f"New sensor discovered: {sensor_name} on pins {pin_list}")
-                self.discovered_sensors[sensor_name] = {
-                    'pins': pin_list,
-                    'last_seen': time.time(),
-                    'payload': payload
-                }
+                self.discovered_sensors[sensor_name] = DiscoveredSensor(
+                    tuple(pin_list), time.monotonic(), payload
+                )
                 # Notify discovery callback
                 if self.sensor_discovery_callback:
                     self.sensor_discovery_callback(sensor_name, pin_list, payload)
             else:
                 # Update last seen timestamp
-                self.discovered_sensors[sensor_name]['last_seen'] = time.time()
-                self.discovered_sensors[sensor_name]['payload'] = payload
+                record.last_seen = time.monotonic()
+                record.payload = payload
             
-            # Also trigger regular data callback if registered
-            if sensor_name in self.callbacks:
-                # Parse payload as data
-                data_values = [payload]
-                self.callbacks[sensor_name](data_values)
+            # Also deliver the payload as data: queued with the sensor's other
+            # samples for batch subscribers, directly for per-sample callbacks
+            if sensor_name in self.batch_callbacks:
+                self._pending[sensor_name].append(
+                    (time.monotonic_ns(), self._payload_values(payload))
+                )
+            else:
+                callback = self.callbacks.get(sensor_name)
+                if callback:
+                    callback([payload])
                 
         except Exception as e:
             logger.error(f"Error parsing header '{header_line}': {e}")
     
+    @staticmethod
+    def _payload_values(payload):
+        """Reduce a header payload to comma-separated value bytes.
+        
+        Example: "x:0.02,y:-0.01,z:9.81" -> b"0.02,-0.01,9.81"
+        """
+        values = []
+        for part in payload.split(','):
+            label, sep, value = part.partition(':')
+            match = NUMBER_PATTERN.search(value if sep else part)
+            values.append(match.group() if match else '')
+        return ','.join(values).encode('ascii')
+    
     def set_discovery_callback(self, callback):
         """Set callback to be called when new sensor is discovered.
         
@@ -193,7 +328,7 @@ class PySerialCommunication(CommunicationInterface):
     
     def get_discovered_sensors(self):
         """Get list of discovered sensor names."""
-        return list(self.discovered_sensors.keys())
+        return list(self.discovered_sensors)
     
     def query_sensors(self):
         """Return currently discovered sensors (passive discovery)."""
@@ -201,15 +336,22 @@ class PySerialCommunication(CommunicationInterface):
 
     def close(self):
         self.running = False
-        if self.serial_conn and self.serial_conn.is_open:
-            try:
-                self.serial_conn.close()
-                logger.info("Serial connection closed successfully")
-            except Exception as e:
-                logger.error(f"Error closing serial connection: {e}")
+        self._stop_event.set()
+        if self.thread.is_alive() and threading.current_thread() is not self.thread:
+            self.thread.join(timeout=1.0)
+        with self.serial_lock:
+            if self.serial_conn and self.serial_conn.is_open:
+                try:
+                    self.serial_conn.close()
+                    logger.info("Serial connection closed successfully")
+                except Exception as e:
+                    logger.error(f"Error closing serial connection: {e}")
 
-        else:
-            logger.info("No active serial connection to close")
+            else:
+                logger.info("No active serial connection to close")
+            # Release the selector's descriptor (an epoll fd on Linux)
+            self._fd = None
+            self._selector.close()
 
 
 # ZCM Communication Implementation
@@ -231,9 +373,9 @@ class ZCMCommunication(CommunicationInterface):
             self.thread.start()
 
     def message_handler(self, channel, message):
-        if channel in self.callbacks:
-            data_values = self.parse_message(message)
-            self.callbacks[channel](data_values)
+        callback = self.callbacks.get(channel)
+        if callback:
+            callback(self.parse_message(message))
 
     def parse_message(self, message):
         # Implement message parsing based on your ZCM message format
@@ -1,19 +1,13 @@
 from .base_sensor import BaseSensor
 from services.tcp_communication_service import CommunicationService
-from typing import List, Dict
 
 class Sensor(BaseSensor):
-    def __init__(self, communication_service: CommunicationService):
-        super().__init__(communication_service)
-    
-    def get_name(self) -> str:
-        return 'GPS Sensor'
+    __slots__ = ()
     
-    def get_sensor_id(self) -> str:
-        return 'GPS_SENSOR'
+    NAME = 'GPS Sensor'
+    SENSOR_ID = 'GPS_SENSOR'
+    DATA_FIELDS = ('latitude', 'longitude', 'altitude')
+    UNITS = {'latitude': '°', 'longitude': '°', 'altitude': 'm'}
     
-    def get_data_fields(self) -> List[str]:
-        return ['latitude', 'longitude', 'altitude']
-    
-    def get_units(self) -> Dict[str, str]:
-        return {'latitude': '°', 'longitude': '°', 'altitude': 'm'}
+    def __init__(self, communication_service: CommunicationService):
+        super().__init__(communication_service)
@@ -1,19 +1,13 @@
 from .base_sensor import BaseSensor
 from services.tcp_communication_service import CommunicationService
-from typing import List, Dict
 
 class Sensor(BaseSensor):
-    def __init__(self, communication_service: CommunicationService):
-        super().__init__(communication_service)
-    
-    def get_name(self) -> str:
-        return 'Pressure Sensor'
+    __slots__ = ()
     
-    def get_sensor_id(self) -> str:
-        return 'PRESSURE_SENSOR'
+    NAME = 'Pressure Sensor'
+    SENSOR_ID = 'PRESSURE_SENSOR'
+    DATA_FIELDS = ('pressure',)
+    UNITS = {'pressure': 'PSI'}
     
-    def get_data_fields(self) -> List[str]:
-        return ['pressure']
-    
-    def get_units(self) -> Dict[str, str]:
-        return {'pressure': 'PSI'}
+    def __init__(self, communication_service: CommunicationService):
+        super().__init__(communication_service)
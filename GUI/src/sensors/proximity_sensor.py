@@ -1,19 +1,13 @@
 from .base_sensor import BaseSensor
 from services.tcp_communication_service import CommunicationService
-from typing import List, Dict
 
 class Sensor(BaseSensor):
-    def __init__(self, communication_service: CommunicationService):
-        super().__init__(communication_service)
-    
-    def get_name(self) -> str:
-        return 'Proximity Sensor'
+    __slots__ = ()
     
-    def get_sensor_id(self) -> str:
-        return 'PROXIMITY_SENSOR'
+    NAME = 'Proximity Sensor'
+    SENSOR_ID = 'PROXIMITY_SENSOR'
+    DATA_FIELDS = ('distance', 'signal_strength')
+    UNITS = {'distance': 'cm', 'signal_strength': '%'}
     
-    def get_data_fields(self) -> List[str]:
-        return ['distance', 'signal_strength']
-    
-    def get_units(self) -> Dict[str, str]:
-        return {'distance': 'cm', 'signal_strength': '%'}
+    def __init__(self, communication_service: CommunicationService):
+        super().__init__(communication_service)
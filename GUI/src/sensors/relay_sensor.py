@@ -1,19 +1,13 @@
 from .base_sensor import BaseSensor
 from services.tcp_communication_service import CommunicationService
-from typing import List, Dict
 
 class Sensor(BaseSensor):
-    def __init__(self, communication_service: CommunicationService):
-        super().__init__(communication_service)
-    
-    def get_name(self) -> str:
-        return 'Relay Control'
+    __slots__ = ()
     
-    def get_sensor_id(self) -> str:
-        return 'RELAY_SENSOR'
+    NAME = 'Relay Control'
+    SENSOR_ID = 'RELAY_SENSOR'
+    DATA_FIELDS = ('state', 'voltage')
+    UNITS = {'state': 'bool', 'voltage': 'V'}
     
-    def get_data_fields(self) -> List[str]:
-        return ['state', 'voltage']
-    
-    def get_units(self) -> Dict[str, str]:
-        return {'state': 'bool', 'voltage': 'V'}
+    def __init__(self, communication_service: CommunicationService):
+        super().__init__(communication_service)
@@ -1,11 +1,9 @@
 """
-Sensor Registry - Hardcoded loading of all valid sensor class files
+Sensor Registry - Hardcoded table of all valid sensor classes
 """
 
-import importlib
-import os
-from pathlib import Path
-from typing import Dict, List, Type, Any
+from functools import lru_cache
+from typing import Dict, Optional, Tuple, Type, Any
 import logging
 
 logger = logging.getLogger(__name__)
@@ -15,93 +13,61 @@ class SensorRegistry:
     
     def __init__(self):
         self.sensor_classes: Dict[str, Type] = {}
+        self._ids_by_name: Dict[str, str] = {}
         self._load_all_sensors()
+        
+        # The registry is fixed after loading, so answer lookups from prebuilt views
+        self._all_ids: Tuple[str, ...] = tuple(self.sensor_classes)
+        self._all_names: Tuple[str, ...] = tuple(info['name'] for info in self.sensor_classes.values())
+        self._class_by_id: Dict[str, Type] = {
+            sensor_id: info['class'] for sensor_id, info in self.sensor_classes.items()
+        }
     
     def _load_all_sensors(self):
-        """Hardcode load all valid sensor.py files"""
-        # List of all valid sensor files (without .py extension)
-        sensor_files = [
-            'ultrasonic_sensor',
-            'vl6180x_sensor',
-            'accelerometer_sensor', 
-            'pressure_sensor',
-            'temperature_sensor',
-            'thermistor_sensor',
-            'line_sensor',
-            'proximity_sensor',
-            'servo_sensor',
-            'vibration_sensor',
-            'relay_sensor',
-            'nrf24l01_sensor',
-            'gps_sensor'
-        ]
-        
-        sensors_dir = Path(__file__).parent
+        """Register every sensor class from the static sensor table"""
+        # Imported here so the sensor modules load with the registry, not with this module
+        from ._manifest import SENSOR_CLASSES
         
-        for sensor_file in sensor_files:
+        for sensor_class in SENSOR_CLASSES:
+            # Metadata lives on the class, so no instance is needed
             try:
-                # Check if file exists
-                file_path = sensors_dir / f"{sensor_file}.py"
-                if not file_path.exists():
-                    logger.warning(f"Sensor file not found: {sensor_file}.py")
-                    continue
+                sensor_id = sensor_class.SENSOR_ID
+                sensor_name = sensor_class.NAME
+                data_fields = list(sensor_class.DATA_FIELDS)
+                units = sensor_class.get_units()
                 
-                # Import the module
-                module_name = f"sensors.{sensor_file}"
-                module = importlib.import_module(module_name)
+                self.sensor_classes[sensor_id] = {
+                    'class': sensor_class,
+                    'name': sensor_name,
+                    'module': sensor_class.__module__.rpartition('.')[2],
+                    'data_fields': data_fields,
+                    'units': units
+                }
+                self._ids_by_name.setdefault(sensor_name, sensor_id)
                 
-                # Get the Sensor class from the module
-                if hasattr(module, 'Sensor'):
-                    sensor_class = getattr(module, 'Sensor')
-                    
-                    # Extract sensor metadata without creating a full instance
-                    # Use class methods that don't require communication service
-                    try:
-                        # Create a minimal mock instance to get metadata without calling _register_callback
-                        class MetadataOnlySensor(sensor_class):
-                            def __init__(self):
-                                # Skip the parent __init__ to avoid communication service requirement
-                                pass
-                        
-                        metadata_instance = MetadataOnlySensor() 
-                        sensor_id = metadata_instance.get_sensor_id()
-                        sensor_name = metadata_instance.get_name()
-                        data_fields = metadata_instance.get_data_fields()
-                        units = metadata_instance.get_units()
-                        
-                        self.sensor_classes[sensor_id] = {
-                            'class': sensor_class,
-                            'name': sensor_name,
-                            'module': sensor_file,
-                            'data_fields': data_fields,
-                            'units': units
-                        }
-                        
-                        logger.info(f"Loaded sensor: {sensor_name} ({sensor_id})")
-                    except Exception as e:
-                        logger.error(f"Failed to extract metadata from {sensor_file}: {e}")
-                else:
-                    logger.error(f"No 'Sensor' class found in {sensor_file}.py")
-                    
+                logger.info(f"Loaded sensor: {sensor_name} ({sensor_id})")
             except Exception as e:
-                logger.error(f"Failed to load sensor {sensor_file}: {e}")
+                logger.error(f"Failed to extract metadata from {sensor_class.__module__}: {e}")
     
-    def get_all_sensor_ids(self) -> List[str]:
-        """Get list of all sensor IDs"""
-        return list(self.sensor_classes.keys())
+    def get_all_sensor_ids(self) -> Tuple[str, ...]:
+        """Get all sensor IDs"""
+        return self._all_ids
     
-    def get_all_sensor_names(self) -> List[str]:
-        """Get list of all sensor names"""
-        return [info['name'] for info in self.sensor_classes.values()]
+    def get_all_sensor_names(self) -> Tuple[str, ...]:
+        """Get all sensor names"""
+        return self._all_names
     
     def get_sensor_info(self, sensor_id: str) -> Dict[str, Any]:
         """Get sensor information by ID"""
         return self.sensor_classes.get(sensor_id, {})
     
+    def get_sensor_id_by_name(self, sensor_name: str) -> Optional[str]:
+        """Get sensor ID by display name"""
+        return self._ids_by_name.get(sensor_name)
+    
     def get_sensor_class(self, sensor_id: str) -> Type:
         """Get sensor class by ID"""
-        info = self.sensor_classes.get(sensor_id)
-        return info['class'] if info else None
+        return self._class_by_id.get(sensor_id)
     
     def create_sensor_instance(self, sensor_id: str, communication_service):
         """Create an instance of a sensor"""
@@ -112,7 +78,17 @@ class SensorRegistry:
     
     def get_sensor_count(self) -> int:
         """Get total number of registered sensors"""
-        return len(self.sensor_classes)
+        return len(self._all_ids)
+
+@lru_cache(maxsize=1)
+def get_registry() -> SensorRegistry:
+    """Get the shared registry, building it on first use"""
+    return SensorRegistry()
+
 
-# Global registry instance
-sensor_registry = SensorRegistry()
+def __getattr__(name: str):
+    # Keep ``from sensors.sensor_registry import sensor_registry`` working
+    # without building the registry at import time
+    if name == 'sensor_registry':
+        return get_registry()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,19 +1,13 @@
 from .base_sensor import BaseSensor
 from services.tcp_communication_service import CommunicationService
-from typing import List, Dict
 
 class Sensor(BaseSensor):
-    def __init__(self, communication_service: CommunicationService):
-        super().__init__(communication_service)
-    
-    def get_name(self) -> str:
-        return 'Ultrasonic Sensor'
+    __slots__ = ()
     
-    def get_sensor_id(self) -> str:
-        return 'ULTRASONIC_SENSOR'
+    NAME = 'Ultrasonic Sensor'
+    SENSOR_ID = 'ULTRASONIC_SENSOR'
+    DATA_FIELDS = ('distance',)
+    UNITS = {'distance': 'cm'}
     
-    def get_data_fields(self) -> List[str]:
-        return ['distance']
-    
-    def get_units(self) -> Dict[str, str]:
-        return {'distance': 'cm'}
+    def __init__(self, communication_service: CommunicationService):
+        super().__init__(communication_service)
@@ -1,19 +1,13 @@
 from .base_sensor import BaseSensor
 from services.tcp_communication_service import CommunicationService
-from typing import List, Dict
 
 class Sensor(BaseSensor):
-    def __init__(self, communication_service: CommunicationService):
-        super().__init__(communication_service)
-    
-    def get_name(self) -> str:
-        return 'Vibration Sensor'
+    __slots__ = ()
     
-    def get_sensor_id(self) -> str:
-        return 'VIBRATION_SENSOR'
+    NAME = 'Vibration Sensor'
+    SENSOR_ID = 'VIBRATION_SENSOR'
+    DATA_FIELDS = ('intensity', 'frequency')
+    UNITS = {'intensity': 'g', 'frequency': 'Hz'}
     
-    def get_data_fields(self) -> List[str]:
-        return ['intensity', 'frequency']
-    
-    def get_units(self) -> Dict[str, str]:
-        return {'intensity': 'g', 'frequency': 'Hz'}
+    def __init__(self, communication_service: CommunicationService):
+        super().__init__(communication_service)
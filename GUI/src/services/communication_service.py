@@ -1,23 +1,33 @@
 # services/communication_service.py
 """
-Communication service for serial communication with microcontrollers.
+Direct serial communication with microcontrollers.
 Passively listens to any device printing to the configured serial port at the specified baud rate.
 Uses line buffering and runs on a separate thread to prevent GUI lag.
+
+The application talks to the serial server through
+services.tcp_communication_service.CommunicationService; this module only
+provides the in-process serial reader.
 """
 
+import logging
+import queue
 import threading
 import time
 from abc import ABC, abstractmethod
-from collections import deque
 import serial
-import sys
-from pathlib import Path
 
 # Use PYTHONPATH for imports
 from config.log_config import get_logger
+from utils.data_processing import HEADER_PATTERN, NUMBER_PATTERN
 
 logger = get_logger(__name__)
 
+# Seconds between periodic status log lines
+STATUS_LOG_INTERVAL = 30
+
+# Line batches (one per serial read) held between the read and dispatch threads
+DISPATCH_QUEUE_SIZE = 1024
+
 
 class BaseCommunication(ABC):
     """Abstract base class for all communication implementations."""
@@ -54,13 +64,13 @@ class BaseCommunication(ABC):
         Callback signature: callback(data_values: list)
         """
         self.sensor_data_callbacks[sensor_name] = callback
-        logger.debug(f"Registered data callback for sensor: {sensor_name}")
+        logger.debug("Registered data callback for sensor: %s", sensor_name)
     
     def deregister_data_callback(self, sensor_name):
         """Deregister a callback for sensor data."""
         if sensor_name in self.sensor_data_callbacks:
             del self.sensor_data_callbacks[sensor_name]
-            logger.debug(f"Deregistered data callback for sensor: {sensor_name}")
+            logger.debug("Deregistered data callback for sensor: %s", sensor_name)
 
 
 class PySerialCommunication(BaseCommunication):
@@ -74,18 +84,25 @@ class PySerialCommunication(BaseCommunication):
         self.port = port
         self.baudrate = baudrate
         self.timeout = timeout
-        self.buffer_size = buffer_size
+        # Ring capacity is rounded up to a power of two so slots index with a mask
+        self.buffer_size = 1 << max(0, buffer_size - 1).bit_length()
+        self._ring_mask = self.buffer_size - 1
         
         self.serial_conn = None
         self.running = False
         self.read_thread = None
-        self.line_buffer = deque(maxlen=buffer_size)
+        self.dispatch_thread = None
+        self._dispatch_q = queue.Queue(maxsize=DISPATCH_QUEUE_SIZE)
+        self._ring = [None] * self.buffer_size  # Recent lines as bytes; written only by the read thread
+        self._ring_head = 0  # Total lines written; next slot is head & mask
+        self._rxbuf = bytearray()  # Bytes received but not yet framed into a line
         self.discovered_sensors = {}  # {sensor_name: {'pins': [], 'last_seen': timestamp}}
         
         # Debug counters for logging
         self.lines_read_count = 0
         self.bytes_read_count = 0
-        self.last_status_log = time.time()
+        self.dropped_lines_count = 0
+        self._next_status_log = time.monotonic() + STATUS_LOG_INTERVAL
         
         logger.info(f"PySerialCommunication initialized for port {port} at {baudrate} baud")
     
@@ -98,6 +115,10 @@ class PySerialCommunication(BaseCommunication):
         self.running = True
         self._connect()
         
+        # Start dispatch thread first so the reader always has a consumer
+        self.dispatch_thread = threading.Thread(target=self._dispatch_loop, name="SerialDispatchThread", daemon=True)
+        self.dispatch_thread.start()
+        
         # Start reading thread
         self.read_thread = threading.Thread(target=self._read_loop, name="SerialReadThread", daemon=True)
         self.read_thread.start()
@@ -108,6 +129,11 @@ class PySerialCommunication(BaseCommunication):
         self.running = False
         if self.read_thread:
             self.read_thread.join(timeout=2.0)
+        if self.dispatch_thread:
+            # Sentinel lets the dispatcher finish queued lines, then exit
+            self._dispatch_q.put(None)
+            self.dispatch_thread.join(timeout=2.0)
+            self.dispatch_thread = None
         logger.info("Serial reading thread stopped")
     
     def close(self):
@@ -137,6 +163,7 @@ class PySerialCommunication(BaseCommunication):
             time.sleep(2)
             # Clear any startup noise
             self.serial_conn.reset_input_buffer()
+            self._rxbuf.clear()
             logger.info(f"Successfully connected to {self.port}")
             
         except serial.SerialException as e:
@@ -149,10 +176,17 @@ class PySerialCommunication(BaseCommunication):
     def _read_loop(self):
         """
         Main reading loop that runs on a separate thread.
-        Uses read_until() to read complete lines with buffering.
+        Reads whatever bytes are waiting and frames lines locally with bytes.find().
+        Lines stay as bytes; they are decoded only where text is actually needed.
         """
         logger.info("Serial read loop started")
         
+        # Bind per-line lookups once outside the loop
+        ring = self._ring
+        mask = self._ring_mask
+        enqueue_lines = self._dispatch_q.put_nowait
+        rxbuf = self._rxbuf
+        
         while self.running:
             # Check if connected
             if not self.serial_conn or not self.serial_conn.is_open:
@@ -162,45 +196,55 @@ class PySerialCommunication(BaseCommunication):
                 continue
             
             try:
-                # Read until newline character (blocking with timeout)
-                line_bytes = self.serial_conn.read_until(b'\n')
+                # Block for the first byte (up to the timeout), then take everything already waiting
+                chunk = self.serial_conn.read(max(1, self.serial_conn.in_waiting))
                 
-                # Log raw bytes received (for debugging)
-                if line_bytes:
-                    self.bytes_read_count += len(line_bytes)
-                    logger.debug(f"Raw bytes received ({len(line_bytes)} bytes): {line_bytes}")
-                
-                if line_bytes:
-                    try:
-                        # Decode and strip whitespace
-                        line = line_bytes.decode('utf-8', errors='ignore').strip()
+                if chunk:
+                    self.bytes_read_count += len(chunk)
+                    if logger.isEnabledFor(logging.DEBUG):
+                        logger.debug("Raw bytes received (%d bytes): %r", len(chunk), chunk)
+                    rxbuf += chunk
+                    
+                    # Frame complete lines out of the receive buffer
+                    lines = []
+                    log_lines = logger.isEnabledFor(logging.INFO)
+                    while (newline := rxbuf.find(b'\n')) >= 0:
+                        line = bytes(rxbuf[:newline]).strip()
+                        del rxbuf[:newline + 1]
                         
                         # Log every line received (even empty ones)
-                        logger.info(f"Serial line received: '{line}'")
+                        if log_lines:
+                            logger.info("Serial line received: '%s'", line.decode('utf-8', 'ignore'))
                         self.lines_read_count += 1
                         
                         if line:
-                            # Add to buffer
-                            self.line_buffer.append(line)
-                            
-                            # Process the line
-                            self._process_line(line)
+                            lines.append(line)
                         else:
                             logger.debug("Received empty line (after stripping)")
-                            
-                    except UnicodeDecodeError as e:
-                        # Log decode errors with raw data
-                        logger.warning(f"Decode error on line {line_bytes}: {e}")
-                        continue
+                    
+                    if lines:
+                        # Add the whole read to the buffer
+                        head = self._ring_head
+                        for line in lines:
+                            ring[head & mask] = line
+                            head += 1
+                        self._ring_head = head
+                        
+                        # Hand the batch to the dispatch thread in one put; never block the reader
+                        try:
+                            enqueue_lines(lines)
+                        except queue.Full:
+                            self.dropped_lines_count += len(lines)
+                            logger.debug("Dispatch queue full, dropped %d lines", len(lines))
                 else:
                     # Log when no data is received (timeout)
                     logger.debug("No data received (timeout or empty read)")
                 
                 # Periodic status logging every 30 seconds
-                current_time = time.time()
-                if current_time - self.last_status_log > 30:
+                now = time.monotonic()
+                if now >= self._next_status_log:
                     self._log_status()
-                    self.last_status_log = current_time
+                    self._next_status_log = now + STATUS_LOG_INTERVAL
                         
             except serial.SerialException as e:
                 logger.error(f"Serial read error: {e}")
@@ -219,14 +263,40 @@ class PySerialCommunication(BaseCommunication):
         
         logger.info("Serial read loop stopped")
     
+    def _dispatch_loop(self):
+        """
+        Consumer loop that parses lines and runs callbacks off the read thread.
+        Each queue item is the list of lines framed from one serial read.
+        Drains everything already queued per wakeup; exits on a None sentinel.
+        """
+        get_lines = self._dispatch_q.get
+        get_lines_nowait = self._dispatch_q.get_nowait
+        process_line = self._process_line
+        
+        while True:
+            batches = [get_lines()]
+            while True:
+                try:
+                    batches.append(get_lines_nowait())
+                except queue.Empty:
+                    break
+            
+            for lines in batches:
+                if lines is None:
+                    logger.info("Serial dispatch loop stopped")
+                    return
+                for line in lines:
+                    process_line(line)
+    
     def _log_status(self):
         """Log periodic status information for debugging."""
-        buffer_usage = len(self.line_buffer)
+        buffer_usage = min(self._ring_head, self.buffer_size)
         connection_status = "Connected" if (self.serial_conn and self.serial_conn.is_open) else "Disconnected"
         
         logger.info(f"Serial Status - Connection: {connection_status}, "
                    f"Lines read: {self.lines_read_count}, "
                    f"Bytes read: {self.bytes_read_count}, "
+                   f"Dropped lines: {self.dropped_lines_count}, "
                    f"Buffer usage: {buffer_usage}/{self.buffer_size}, "
                    f"Discovered sensors: {len(self.discovered_sensors)}")
         
@@ -235,17 +305,17 @@ class PySerialCommunication(BaseCommunication):
             logger.info(f"Active sensors: {sensor_names}")
     
     def _process_line(self, line):
-        """Process a received line - either header or data."""
+        """Process a received line (bytes) - either header or data."""
         try:
             # Check if this is a header message
-            if line.startswith('*H*_'):
-                self._parse_header(line)
+            if line.startswith(b'*H*_'):
+                self._parse_header(line.decode('utf-8', 'ignore'))
             else:
                 # Regular data message (sensor_name:value1,value2,...)
                 self._parse_data(line)
                 
         except Exception as e:
-            logger.debug(f"Error processing line '{line}': {e}")
+            logger.debug("Error processing line %r: %s", line, e)
     
     def _parse_header(self, header_line):
         """
@@ -253,17 +323,12 @@ class PySerialCommunication(BaseCommunication):
         Example: *H*_temperature_A0_temp:25.5C
         """
         try:
-            # Remove *H*_ prefix
-            content = header_line[4:]
-            parts = content.split('_', 2)
-            
-            if len(parts) < 3:
+            match = HEADER_PATTERN.match(header_line)
+            if not match:
                 logger.warning(f"Invalid header format (expected 3 parts): {header_line}")
                 return
             
-            sensor_name = parts[0].strip()
-            pin_list_str = parts[1].strip()
-            payload = parts[2].strip()
+            sensor_name, pin_list_str, payload = (part.strip() for part in match.groups())
             
             # Parse pin list
             pins = [pin.strip() for pin in pin_list_str.split(',') if pin.strip()]
@@ -285,10 +350,11 @@ class PySerialCommunication(BaseCommunication):
                     self.sensor_discovery_callback(sensor_name, pins, payload)
             
             # Also process the payload as data
-            if sensor_name in self.sensor_data_callbacks:
+            callback = self.sensor_data_callbacks.get(sensor_name)
+            if callback:
                 # Extract just the values from payload (e.g., "temp:25.5C" -> ["25.5"])
                 data_values = self._extract_values_from_payload(payload)
-                self.sensor_data_callbacks[sensor_name](data_values)
+                callback(data_values)
                 
         except Exception as e:
             logger.error(f"Error parsing header '{header_line}': {e}")
@@ -296,26 +362,28 @@ class PySerialCommunication(BaseCommunication):
     def _parse_data(self, data_line):
         """
         Parse regular data line format: sensor_name:value1,value2,...
-        Example: temperature:25.6
+        Example: b'temperature:25.6'
+        Only the name is decoded up front; values are decoded for subscribed sensors.
         """
         try:
-            if ':' not in data_line:
+            sensor_name, sep, values_bytes = data_line.partition(b':')
+            if not sep:
                 return
-            
-            sensor_name, values_str = data_line.split(':', 1)
-            sensor_name = sensor_name.strip()
+            sensor_name = sensor_name.strip().decode('utf-8', 'ignore')
             
             # Update last seen time
             if sensor_name in self.discovered_sensors:
                 self.discovered_sensors[sensor_name]['last_seen'] = time.time()
             
             # Call data callback if registered
-            if sensor_name in self.sensor_data_callbacks:
+            callback = self.sensor_data_callbacks.get(sensor_name)
+            if callback:
+                values_str = values_bytes.decode('utf-8', 'ignore')
                 data_values = [v.strip() for v in values_str.split(',')]
-                self.sensor_data_callbacks[sensor_name](data_values)
+                callback(data_values)
                 
         except Exception as e:
-            logger.debug(f"Error parsing data line '{data_line}': {e}")
+            logger.debug("Error parsing data line %r: %s", data_line, e)
     
     def _extract_values_from_payload(self, payload):
         """
@@ -325,15 +393,13 @@ class PySerialCommunication(BaseCommunication):
             "x:0.02,y:-0.01,z:9.81" -> ["0.02", "-0.01", "9.81"]
         """
         values = []
-        parts = payload.split(',')
-        for part in parts:
-            if ':' in part:
-                # Extract value after colon
-                value = part.split(':', 1)[1]
-                # Remove units (letters at the end)
-                value_clean = ''.join(c for c in value if c.isdigit() or c in '.-')
-                if value_clean:
-                    values.append(value_clean)
+        for part in payload.split(','):
+            label, sep, value = part.partition(':')
+            if sep:
+                # Keep the number after the colon, dropping any unit suffix
+                match = NUMBER_PATTERN.search(value)
+                if match:
+                    values.append(match.group())
             else:
                 values.append(part.strip())
         return values
@@ -343,77 +409,9 @@ class PySerialCommunication(BaseCommunication):
         return list(self.discovered_sensors.keys())
     
     def get_buffer_lines(self, n=10):
-        """Get the last n lines from the buffer."""
-        return list(self.line_buffer)[-n:]
-
-
-class CommunicationService:
-    """
-    High-level communication service that manages serial communication.
-    This is the main interface used by the application.
-    """
-    
-    def __init__(self, config):
-        """
-        Initialize the communication service.
-        
-        Args:
-            config: CommunicationConfig object with port, baudrate, timeout
-        """
-        self.config = config
-        self.comm = None
-        
-        # Only use real serial communication
-        if config.port and config.port != 'none':
-            logger.info(f"Using PySerialCommunication on port {config.port}")
-            self.comm = PySerialCommunication(
-                port=config.port,
-                baudrate=config.baudrate,
-                timeout=config.timeout / 1000.0  # Convert ms to seconds
-            )
-            # Start communication
-            self.comm.start()
-            logger.info("Communication service initialized and started")
-        else:
-            logger.info("No serial port configured - communication service disabled")
-            self.comm = None
-    
-    def set_discovery_callback(self, callback):
-        """Set callback for sensor discovery."""
-        if self.comm:
-            return self.comm.set_discovery_callback(callback)
-        return False
-    
-    def register_data_callback(self, sensor_name, callback):
-        """Register callback for sensor data."""
-        if self.comm:
-            return self.comm.register_data_callback(sensor_name, callback)
-        return False
-    
-    def deregister_data_callback(self, sensor_name):
-        """Deregister callback for sensor data."""
-        if self.comm:
-            return self.comm.deregister_data_callback(sensor_name)
-        return False
-    
-    def get_discovered_sensors(self):
-        """Get list of discovered sensor names."""
-        if self.comm:
-            return self.comm.get_discovered_sensors()
-        return []
-    
-    def get_buffer_lines(self, n=10):
-        """Get the last n lines from the buffer."""
-        if self.comm:
-            return self.comm.get_buffer_lines(n)
-        return []
-    
-    def is_connected(self):
-        """Check if communication is active."""
-        return self.comm is not None and hasattr(self.comm, 'is_connected') and self.comm.is_connected()
-    
-    def close(self):
-        """Close and cleanup the communication service."""
-        if self.comm:
-            self.comm.close()
-            logger.info("Communication service closed")
+        """Get the last n lines from the buffer, decoded for display."""
+        head = self._ring_head
+        n = min(n, head, self.buffer_size)
+        ring = self._ring
+        mask = self._ring_mask
+        return [ring[i & mask].decode('utf-8', 'ignore') for i in range(head - n, head)]
@@ -1,5 +1,6 @@
 """Sensor service for managing sensor operations with dynamic discovery."""
-from typing import List, Dict, Optional
+from collections import deque
+from typing import Deque, List, Dict, Optional
 import time
 import threading
 from datetime import datetime
@@ -9,18 +10,26 @@ import sys
 from pathlib import Path
 # Use PYTHONPATH for imports
 from config.log_config import get_logger
+from config.settings import MAX_DATA_POINTS
 from services.tcp_communication_service import CommunicationService
+from utils.data_processing import NUMBER_PATTERN
 
 logger = get_logger(__name__)
 
 
+def _parse_number(value_str: str) -> float:
+    """Return the number after any "label:" prefix, or 0.0 if there is none."""
+    match = NUMBER_PATTERN.search(value_str.rpartition(':')[2])
+    return float(match.group()) if match else 0.0
+
+
 class DynamicSensor:
     """Dynamically created sensor that holds data."""
     
     def __init__(self, name: str, pins: List[str]):
         self.name = name
         self.pins = pins
-        self.data: List[Dict] = []
+        self.data: Deque[Dict] = deque(maxlen=MAX_DATA_POINTS)
         self._is_active = True
         self.last_update = time.time()
     
@@ -34,34 +43,14 @@ class DynamicSensor:
             values = payload.split(',')
             
             if len(values) == 1:
-                # Single value - extract number
-                value_str = values[0]
-                # Remove any labels (e.g., "temp:25.5C" -> "25.5")
-                if ':' in value_str:
-                    value_str = value_str.split(':', 1)[1]
-                # Remove units (letters at end)
-                value_clean = ''.join(c for c in value_str if c.isdigit() or c in '.-')
-                try:
-                    data_dict['value'] = float(value_clean) if value_clean else 0.0
-                except ValueError:
-                    data_dict['value'] = 0.0
+                # Single value, e.g. "temp:25.5C" -> 25.5
+                data_dict['value'] = _parse_number(values[0])
             else:
                 # Multiple values
                 for i, val in enumerate(values):
-                    # Extract number from each value
-                    val_str = val.strip()
-                    if ':' in val_str:
-                        val_str = val_str.split(':', 1)[1]
-                    val_clean = ''.join(c for c in val_str if c.isdigit() or c in '.-')
-                    try:
-                        data_dict[f'value_{i}'] = float(val_clean) if val_clean else 0.0
-                    except ValueError:
-                        data_dict[f'value_{i}'] = 0.0
+                    data_dict[f'value_{i}'] = _parse_number(val)
             
             self.data.append(data_dict)
-            # Keep only recent data (last 1000 points)
-            if len(self.data) > 1000:
-                self.data = self.data[-1000:]
             self.last_update = time.time()
         except Exception as e:
             logger.error(f"Error updating data for {self.name}: {e}")
@@ -71,7 +60,7 @@ class DynamicSensor:
         try:
             if not self.data:
                 return pd.DataFrame()
-            return pd.DataFrame(self.data)
+            return pd.DataFrame(list(self.data))
         except Exception as e:
             logger.error(f"Error getting data for {self.name}: {e}")
             return pd.DataFrame()
@@ -163,7 +152,7 @@ class SensorService:
             try:
                 current_time = time.time()
                 
-                for sensor_name, last_seen in list(self._watchdog_timers.items()):
+                for sensor_name, last_seen in tuple(self._watchdog_timers.items()):
                     if current_time - last_seen > self.WATCHDOG_TIMEOUT:
                         # Watchdog timeout - mark sensor as unavailable
                         if self._sensor_availability.get(sensor_name, True):
@@ -230,7 +219,7 @@ class SensorService:
             self._watchdog_thread.join(timeout=2)
         
         # Deregister all sensor callbacks
-        for sensor_name in list(self._sensors.keys()):
+        for sensor_name in tuple(self._sensors):
             try:
                 self.communication_service.deregister_data_callback(sensor_name)
             except Exception as e:
@@ -248,7 +237,7 @@ class SensorService:
         logger.info("Clearing all sensors for microcontroller switch...")
         
         # Deregister all sensor callbacks
-        for sensor_name in list(self._sensors.keys()):
+        for sensor_name in tuple(self._sensors):
             try:
                 self.communication_service.deregister_data_callback(sensor_name)
             except Exception as e:
@@ -1 +0,0 @@
-# New sensor service with dynamic discovery
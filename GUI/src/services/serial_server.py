@@ -15,6 +15,7 @@ Key features:
 
 import json
 import os
+import re
 import socket
 import threading
 import time
@@ -49,6 +50,9 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Seconds between periodic status log lines
+STATUS_LOG_INTERVAL = 30
+
 
 class SerialCommunicationServer:
     """
@@ -63,6 +67,8 @@ class SerialCommunicationServer:
     """
     
     DATA_RETENTION_SECONDS = 5.0  # Keep only last 5 seconds of data
+    CLEANUP_INTERVAL = 0.5  # Seconds between buffer trims
+    CLIENT_UPDATE_INTERVAL = 0.5  # Seconds between periodic updates to each client
     
     def __init__(self, port, baudrate=115200, tcp_port=9999):
         self.serial_port = port
@@ -91,10 +97,12 @@ class SerialCommunicationServer:
         self.cleanup_running = False
         self.cleanup_thread = None
         
+        self._stop_event = threading.Event()  # Set by stop() to wake sleeping threads
+        
         # Statistics
         self.lines_read_count = 0
         self.bytes_read_count = 0
-        self.last_status_log = time.time()
+        self._next_status_log = time.monotonic() + STATUS_LOG_INTERVAL
         
         logger.info(f"Passive serial server initialized for port {port} at {baudrate} baud")
         logger.info(f"TCP server will listen on port {tcp_port}")
@@ -112,6 +120,8 @@ class SerialCommunicationServer:
             logger.error("Failed to establish initial serial connection")
             raise RuntimeError(f"Could not connect to serial port {self.serial_port}")
         
+        self._stop_event.clear()
+        
         # Start buffer cleanup thread
         self.cleanup_running = True
         self.cleanup_thread = threading.Thread(target=self._cleanup_loop, name="CleanupThread", daemon=True)
@@ -135,6 +145,7 @@ class SerialCommunicationServer:
         
         # Stop cleanup thread
         self.cleanup_running = False
+        self._stop_event.set()
         
         # Stop TCP server
         self.tcp_running = False
@@ -145,7 +156,7 @@ class SerialCommunicationServer:
                 pass
         
         # Close all client connections
-        for client in self.connected_clients[:]:
+        for client in tuple(self.connected_clients):
             try:
                 client.close()
             except:
@@ -237,12 +248,12 @@ class SerialCommunicationServer:
             # Check if connected
             if not self.serial_conn or not self.serial_conn.is_open:
                 logger.warning("Serial connection lost, attempting to reconnect...")
-                time.sleep(2)
+                self._stop_event.wait(2)
                 self._connect_serial()
                 # After reconnection attempt, check if it actually succeeded
                 if not self.serial_conn or not self.serial_conn.is_open:
                     logger.debug("Reconnection failed, retrying in 5 seconds...")
-                    time.sleep(5)
+                    self._stop_event.wait(5)
                     continue
             
             try:
@@ -274,10 +285,10 @@ class SerialCommunicationServer:
                     logger.debug("No data received (timeout)")
                 
                 # Periodic status logging
-                current_time = time.time()
-                if current_time - self.last_status_log > 30:
+                now = time.monotonic()
+                if now >= self._next_status_log:
                     self._log_status()
-                    self.last_status_log = current_time
+                    self._next_status_log = now + STATUS_LOG_INTERVAL
                         
             except serial.SerialException as e:
                 logger.error(f"Serial read error: {e}")
@@ -287,11 +298,11 @@ class SerialCommunicationServer:
                     except:
                         pass
                     self.serial_conn = None
-                time.sleep(2)
+                self._stop_event.wait(2)
                 
             except Exception as e:
                 logger.error(f"Unexpected error in serial loop: {e}")
-                time.sleep(0.1)
+                self._stop_event.wait(0.1)
         
         logger.info("Serial read loop stopped")
     
@@ -333,8 +344,8 @@ class SerialCommunicationServer:
                             measurement_parts = sensor_info['payload'].split(',')
                             parsed_values = []
                             for part in measurement_parts:
-                                if ':' in part:
-                                    key, value = part.split(':', 1)
+                                key, sep, value = part.partition(':')
+                                if sep:
                                     parsed_values.append(f"{key.strip()}:{value.strip()}")
                             
                             if parsed_values:
@@ -362,6 +373,7 @@ class SerialCommunicationServer:
         """Background thread to clean up old data from buffer."""
         logger.info("Starting data cleanup thread")
         
+        next_cleanup = time.monotonic()
         while self.cleanup_running:
             try:
                 current_time = time.time()
@@ -372,12 +384,17 @@ class SerialCommunicationServer:
                     while self.data_buffer and self.data_buffer[0][0] < cutoff_time:
                         self.data_buffer.popleft()
                 
-                # Sleep for a bit before next cleanup
-                time.sleep(0.5)  # Cleanup every 500ms
+                # Wait until the next cleanup is due; stop() cuts the wait short
+                next_cleanup += self.CLEANUP_INTERVAL
+                delay = next_cleanup - time.monotonic()
+                if delay > 0:
+                    self._stop_event.wait(delay)
+                else:
+                    next_cleanup = time.monotonic()
                 
             except Exception as e:
                 logger.error(f"Error in cleanup loop: {e}")
-                time.sleep(1.0)
+                self._stop_event.wait(1.0)
         
         logger.info("Data cleanup thread stopped")
     
@@ -422,15 +439,16 @@ class SerialCommunicationServer:
         try:
             # Remove *H*_ prefix
             content = header_line[4:]
-            parts = content.split('_', 2)
+            sensor_name, sep, rest = content.partition('_')
+            pin_list_str, sep2, payload = rest.partition('_')
             
-            if len(parts) < 3:
+            if not (sep and sep2):
                 logger.warning(f"Invalid header format: {header_line}")
                 return None
             
-            sensor_name = parts[0].strip()
-            pin_list_str = parts[1].strip()
-            payload = parts[2].strip()
+            sensor_name = sensor_name.strip()
+            pin_list_str = pin_list_str.strip()
+            payload = payload.strip()
             
             # Parse pin list
             pins = [pin.strip() for pin in pin_list_str.split(',') if pin.strip()]
@@ -462,10 +480,9 @@ class SerialCommunicationServer:
     def _parse_data(self, data_line):
         """Parse regular data line format."""
         try:
-            if ':' not in data_line:
+            sensor_name, sep, values_str = data_line.partition(':')
+            if not sep:
                 return None
-            
-            sensor_name, values_str = data_line.split(':', 1)
             sensor_name = sensor_name.strip()
             
             # Update last seen time
@@ -569,14 +586,14 @@ class SerialCommunicationServer:
         
         try:
             # Send periodic status updates instead of waiting for requests
-            last_status_time = 0
+            next_update = time.monotonic()
             message_buffer = ""
             
-            # Set non-blocking mode
-            client_socket.settimeout(1.0)
-            
             while self.tcp_running:
                 try:
+                    # Wait for requests only until the next periodic update is due
+                    client_socket.settimeout(max(0.01, next_update - time.monotonic()))
+                    
                     # Try to receive data from client (requests)
                     try:
                         data = client_socket.recv(1024).decode('utf-8')
@@ -599,8 +616,10 @@ class SerialCommunicationServer:
                         pass
                     
                     # Send periodic updates to keep connection alive and provide data
-                    current_time = time.time()
-                    if current_time - last_status_time >= 0.5:  # Every 500ms
+                    now = time.monotonic()
+                    if now >= next_update:
+                        current_time = time.time()
+                        
                         # Get recent data
                         recent_data = self._get_data_range(current_time - 1.0, current_time, ['discovery', 'sensor_data'])
                         
@@ -613,7 +632,10 @@ class SerialCommunicationServer:
                             self._send_to_client(client_socket, status_update)
                             logger.debug(f"📤 Sent periodic update to {client_address} with {len(recent_data)} entries")
                         
-                        last_status_time = current_time
+                        # Keep a fixed cadence; skip ahead rather than burst after a stall
+                        next_update += self.CLIENT_UPDATE_INTERVAL
+                        if next_update <= now:
+                            next_update = now + self.CLIENT_UPDATE_INTERVAL
                 
                 except socket.error as e:
                     logger.warning(f"Socket error with client {client_address}: {e}")
@@ -643,11 +665,11 @@ class SerialCommunicationServer:
             message_json = json.dumps(message) + '\n'
             message_bytes = message_json.encode('utf-8')
             
-            # Send to all clients (remove disconnected ones)
+            # Send to a snapshot of the clients (handler threads may remove themselves)
             disconnected_clients = []
-            for client in self.connected_clients:
+            for client in tuple(self.connected_clients):
                 try:
-                    client.send(message_bytes)
+                    client.sendall(message_bytes)
                 except:
                     disconnected_clients.append(client)
             
@@ -668,7 +690,7 @@ class SerialCommunicationServer:
         try:
             message_json = json.dumps(message) + '\n'
             message_bytes = message_json.encode('utf-8')
-            client_socket.send(message_bytes)
+            client_socket.sendall(message_bytes)
         except Exception as e:
             logger.debug(f"Error sending to client: {e}")
     
@@ -865,6 +887,24 @@ class SerialCommunicationServer:
             return False
 
 
+# Microcontroller detection tables, built once at import
+ARDUINO_VIDS = frozenset((0x2341, 0x1A86, 0x10C4, 0x0403))  # Arduino, CH340, CP210x, FTDI
+
+
+def _keyword_pattern(*keywords):
+    """Compile keywords into a single case-insensitive alternation."""
+    return re.compile('|'.join(map(re.escape, keywords)), re.IGNORECASE)
+
+
+BOARD_DESCRIPTION_PATTERN = _keyword_pattern(
+    'arduino uno', 'arduino nano', 'arduino mega', 'arduino leonardo',
+    'esp32', 'esp8266', 'nodemcu', 'wemos'
+)
+CHIP_DESCRIPTION_PATTERN = _keyword_pattern('ch340', 'ch341', 'cp210', 'cp2102', 'ftdi', 'ft232')
+GENERIC_DESCRIPTION_PATTERN = _keyword_pattern('arduino', 'usb serial', 'usb-serial', 'serial converter')
+MANUFACTURER_PATTERN = _keyword_pattern('arduino', 'espressif', 'wch', 'silicon labs', 'ftdi')
+
+
 def detect_microcontroller_ports():
     """Universal microcontroller port detection across all platforms."""
     try:
@@ -886,41 +926,30 @@ def detect_microcontroller_ports():
         }
         
         # Arduino/microcontroller detection patterns
-        description_lower = port_info['description'].lower()
-        manufacturer_lower = port_info['manufacturer'].lower()
+        description = port_info['description']
         
         # High confidence matches (specific Arduino VID/PID)
-        arduino_vids = [0x2341, 0x1A86, 0x10C4, 0x0403]  # Arduino, CH340, CP210x, FTDI
-        if port.vid in arduino_vids:
+        if port.vid in ARDUINO_VIDS:
             port_info['confidence'] = 90
             
         # High confidence based on description
-        elif any(keyword in description_lower for keyword in [
-            'arduino uno', 'arduino nano', 'arduino mega', 'arduino leonardo',
-            'esp32', 'esp8266', 'nodemcu', 'wemos'
-        ]):
+        elif BOARD_DESCRIPTION_PATTERN.search(description):
             port_info['confidence'] = 85
             
         # Medium confidence based on chip identifiers
-        elif any(keyword in description_lower for keyword in [
-            'ch340', 'ch341', 'cp210', 'cp2102', 'ftdi', 'ft232'
-        ]):
+        elif CHIP_DESCRIPTION_PATTERN.search(description):
             port_info['confidence'] = 70
             
         # Low confidence based on generic Arduino terms
-        elif any(keyword in description_lower for keyword in [
-            'arduino', 'usb serial', 'usb-serial', 'serial converter'
-        ]):
+        elif GENERIC_DESCRIPTION_PATTERN.search(description):
             port_info['confidence'] = 50
             
         # Medium confidence for known manufacturers
-        elif any(keyword in manufacturer_lower for keyword in [
-            'arduino', 'espressif', 'wch', 'silicon labs', 'ftdi'
-        ]):
+        elif MANUFACTURER_PATTERN.search(port_info['manufacturer']):
             port_info['confidence'] = 60
         
         # Add port if it has any confidence or is a generic serial port
-        if port_info['confidence'] > 0 or 'serial' in description_lower:
+        if port_info['confidence'] > 0 or 'serial' in description.lower():
             detected_ports.append(port_info)
     
     # Sort by confidence (highest first), then by device name
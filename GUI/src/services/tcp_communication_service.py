@@ -55,6 +55,7 @@ class CommunicationService:
         
         self.socket = None
         self.running = False
+        self._stop_event = threading.Event()  # Set by stop() to wake sleeping threads
         self.client_thread = None
         self.keepalive_thread = None
         
@@ -82,6 +83,19 @@ class CommunicationService:
         self.max_console_messages = 100
         self.console_lock = threading.Lock()
         
+        # Message and data-entry dispatch tables, built once instead of if/elif chains
+        self._response_handlers = {
+            'periodic_update': self._process_data_response,
+            'data_response': self._process_data_response,
+            'status_response': self._process_status_response,
+            'error_response': self._process_error_response,
+            'server_status': self._handle_server_status,
+        }
+        self._entry_handlers = {
+            'discovery': self._handle_sensor_discovery,
+            'sensor_data': self._handle_sensor_data,
+        }
+        
         logger.info(f"TCP Communication initialized to connect to {self.server_host}:{self.server_port}")
         logger.info(f"Server pushes periodic updates every 500ms automatically")
         
@@ -129,6 +143,7 @@ class CommunicationService:
             return
         
         self.running = True
+        self._stop_event.clear()
         
         # Start client thread for receiving periodic updates from server
         self.client_thread = threading.Thread(target=self._client_loop, name="TCPClientThread", daemon=True)
@@ -143,6 +158,7 @@ class CommunicationService:
     def stop(self):
         """Stop the TCP client threads."""
         self.running = False
+        self._stop_event.set()
         
         # Clear pending requests
         with self.request_lock:
@@ -214,7 +230,7 @@ class CommunicationService:
             # Try to connect if not connected
             if not self.socket:
                 if not self._connect_to_server():
-                    time.sleep(self.reconnect_delay)
+                    self._stop_event.wait(self.reconnect_delay)
                     continue
             
             try:
@@ -242,10 +258,10 @@ class CommunicationService:
             except socket.error as e:
                 logger.warning(f"TCP client error: {e}")
                 self._disconnect()
-                time.sleep(self.reconnect_delay)
+                self._stop_event.wait(self.reconnect_delay)
             except Exception as e:
                 logger.error(f"Unexpected error in client loop: {e}")
-                time.sleep(0.1)
+                self._stop_event.wait(0.1)
         
         logger.info("TCP client response loop stopped")
     
@@ -260,12 +276,12 @@ class CommunicationService:
                 if not self.socket or not self.connection_status['connected']:
                     logger.debug("Waiting for connection to be established...")
                 
-                # Sleep to prevent busy waiting
-                time.sleep(2.0)  # Check connection status every 2 seconds
+                # Check connection status every 2 seconds; stop() wakes this immediately
+                self._stop_event.wait(2.0)
                 
             except Exception as e:
                 logger.error(f"Error in keepalive loop: {e}")
-                time.sleep(2.0)
+                self._stop_event.wait(2.0)
         
         logger.info("TCP connection keepalive loop stopped")
     
@@ -303,7 +319,7 @@ class CommunicationService:
             # Send request
             request_json = json.dumps(request_data) + '\n'
             self._log_console_message('sent', request_json.strip())
-            self.socket.send(request_json.encode('utf-8'))
+            self.socket.sendall(request_json.encode('utf-8'))
             
             # Wait for response
             if response_event.wait(timeout):
@@ -351,21 +367,11 @@ class CommunicationService:
         """Process a response received from the serial server."""
         try:
             message_type = message.get('type')
-            logger.debug(f"Received server response: {message_type}")
+            logger.debug("Received server response: %s", message_type)
             
-            if message_type == 'periodic_update':
-                # Handle periodic data updates from server
-                logger.debug(f"📥 Received periodic update with {len(message.get('data', []))} entries")
-                self._process_data_response(message)
-            elif message_type == 'data_response':
-                logger.debug(f"📥 Received data_response with {len(message.get('data', []))} entries")
-                self._process_data_response(message)
-            elif message_type == 'status_response':
-                self._process_status_response(message)
-            elif message_type == 'error_response':
-                self._process_error_response(message)
-            elif message_type == 'server_status':
-                self._handle_server_status(message)
+            handler = self._response_handlers.get(message_type)
+            if handler is not None:
+                handler(message)
             else:
                 # Handle responses with request_id
                 request_id = message.get('request_id')
@@ -388,16 +394,11 @@ class CommunicationService:
             data_entries = response.get('data', [])
             logger.info(f"Processing data response with {len(data_entries)} entries")
             
+            entry_handlers = self._entry_handlers
             for entry in data_entries:
-                entry_type = entry.get('type')
-                logger.debug(f"Processing entry type: {entry_type}")
-                
-                if entry_type == 'discovery':
-                    logger.info(f"Processing discovery entry: {entry.get('sensor_name', 'Unknown')}")
-                    self._handle_sensor_discovery(entry)
-                elif entry_type == 'sensor_data':
-                    logger.info(f"Processing sensor data entry: {entry.get('sensor_name', 'Unknown')} = {entry.get('values', 'N/A')}")
-                    self._handle_sensor_data(entry)
+                handler = entry_handlers.get(entry.get('type'))
+                if handler is not None:
+                    handler(entry)
                 
         except Exception as e:
             logger.error(f"Error processing data response: {e}")
@@ -420,6 +421,7 @@ class CommunicationService:
     def _handle_sensor_discovery(self, entry):
         """Handle sensor discovery entry from server."""
         try:
+            logger.info(f"Processing discovery entry: {entry.get('sensor_name', 'Unknown')}")
             sensor_name = entry['sensor_name']
             pins = entry['pins']
             payload = entry['payload']
@@ -446,6 +448,7 @@ class CommunicationService:
     def _handle_sensor_data(self, entry):
         """Handle sensor data entry from server."""
         try:
+            logger.info(f"Processing sensor data entry: {entry.get('sensor_name', 'Unknown')} = {entry.get('values', 'N/A')}")
             sensor_name = entry['sensor_name']
             values = entry['values']
             timestamp = entry['timestamp']
@@ -470,11 +473,12 @@ class CommunicationService:
                     self.sensor_data_buffer[sensor_name] = self.sensor_data_buffer[sensor_name][-self.max_data_points:]
             
             # Call data callback if registered
-            if sensor_name in self.sensor_data_callbacks:
-                logger.info(f"Calling callback for {sensor_name} with values {values}")
-                self.sensor_data_callbacks[sensor_name](values)
+            callback = self.sensor_data_callbacks.get(sensor_name)
+            if callback:
+                logger.info("Calling callback for %s with values %s", sensor_name, values)
+                callback(values)
             else:
-                logger.debug(f"No callback registered for sensor: {sensor_name}")
+                logger.debug("No callback registered for sensor: %s", sensor_name)
                 
         except Exception as e:
             logger.error(f"Error handling sensor data: {e}")
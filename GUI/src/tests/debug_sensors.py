@@ -3,6 +3,7 @@
 
 import sys
 import time
+from dataclasses import replace
 from pathlib import Path
 
 # Add GUI directory to path
@@ -20,7 +21,7 @@ def test_sensor_data():
     
     # Load config
     config = load_config()
-    config.communication.use_mock = True
+    config = replace(config, communication=replace(config.communication, use_mock=True))
     
     # Initialize services
     comm_service = CommunicationService(config.communication)
@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""Test script for the sensor ring buffers and batched ingest."""
+
+import sys
+import time
+
+# Use PYTHONPATH for imports
+
+
+class StubCommunicationService:
+    """Stands in for the TCP service; only records the batch callback."""
+
+    def __init__(self):
+        self.batch_callbacks = {}
+
+    def register_batch_callback(self, sensor_id, callback):
+        self.batch_callbacks[sensor_id] = callback
+
+
+def make_batch(payloads):
+    """Pair payloads with increasing monotonic timestamps, like the serial reader does."""
+    start = time.monotonic_ns()
+    return [(start + i, payload) for i, payload in enumerate(payloads)]
+
+
+def test_batch_wraps_ring():
+    """A batch wrapping past MAX_DATA_POINTS keeps the newest samples in order."""
+    try:
+        from sensors.base_sensor import MAX_DATA_POINTS
+        from sensors.accelerometer_sensor import Sensor
+
+        service = StubCommunicationService()
+        sensor = Sensor(service)
+        callback = service.batch_callbacks[sensor.sensor_id]
+
+        callback(make_batch([f"{i},{-i},0".encode() for i in range(MAX_DATA_POINTS)]))
+        callback(make_batch([
+            f"{MAX_DATA_POINTS},0,0".encode(),
+            b"abc,1,1",   # non-numeric field is stored as 0.0
+            b"1,2",       # too few fields is dropped
+            f"{MAX_DATA_POINTS + 2},0,0".encode(),
+            f"{MAX_DATA_POINTS + 3},0,0".encode(),
+        ]))
+
+        df = sensor.get_data()
+        assert len(df) == MAX_DATA_POINTS, f"expected {MAX_DATA_POINTS} rows, got {len(df)}"
+        assert df['Time'].is_monotonic_increasing, "rows are not oldest first"
+
+        expected_x = [float(i) for i in range(4, MAX_DATA_POINTS)]
+        expected_x += [float(MAX_DATA_POINTS), 0.0, float(MAX_DATA_POINTS + 2), float(MAX_DATA_POINTS + 3)]
+        assert df['x'].tolist() == expected_x, "x column does not match the newest samples"
+        assert df['y'].iloc[0] == -4.0, f"oldest y should be -4.0, got {df['y'].iloc[0]}"
+        assert df['y'].iloc[-3] == 1.0, f"y of the non-numeric row should be 1.0, got {df['y'].iloc[-3]}"
+        print('✓ Wrapped batch keeps the newest samples in order')
+
+        latest = sensor.get_latest_data()
+        assert latest['x'] == float(MAX_DATA_POINTS + 3), f"unexpected latest sample: {latest}"
+        print('✓ Latest sample is the last row of the batch')
+
+        return True
+
+    except Exception as e:
+        print(f'❌ Ring buffer wrap test failed: {e}')
+        import traceback
+        traceback.print_exc()
+        return False
+
+
+def test_batch_with_empty_payload():
+    """An empty payload for a single-field sensor does not drop the batch."""
+    try:
+        from sensors.temperature_sensor import Sensor
+
+        service = StubCommunicationService()
+        sensor = Sensor(service)
+        callback = service.batch_callbacks[sensor.sensor_id]
+
+        callback(make_batch([b"21.5", b"", b"22.5"]))
+
+        df = sensor.get_data()
+        values = df['temperature'].tolist()
+        assert values == [21.5, 0.0, 22.5], f"unexpected temperatures: {values}"
+        print('✓ Empty payload is stored as 0.0 and the batch is kept')
+
+        return True
+
+    except Exception as e:
+        print(f'❌ Empty payload test failed: {e}')
+        import traceback
+        traceback.print_exc()
+        return False
+
+
+if __name__ == '__main__':
+    success = test_batch_wraps_ring()
+    success = test_batch_with_empty_payload() and success
+    sys.exit(0 if success else 1)
@@ -1,7 +1,7 @@
 """Main application callbacks."""
 from dash.dependencies import Input, Output, State
 from dash import html
-from typing import Dict, Any
+from typing import Callable, Dict, Any
 
 from config.log_config import get_logger
 
@@ -11,9 +11,10 @@ logger = get_logger(__name__)
 class MainCallbacks:
     """Main application callback manager."""
     
-    def __init__(self, pages: Dict[str, Any], default_page: str = 'sensors'):
+    def __init__(self, pages: Dict[str, Callable[[], Any]], default_page: str = 'sensors'):
         self.pages = pages
         self.default_page = default_page
+        self._rendered_pages: Dict[str, Any] = {}
     
     def register(self, app) -> None:
         """Register main application callbacks."""
@@ -39,7 +40,7 @@ class MainCallbacks:
                 
                 # Check if page exists
                 if page_id in self.pages:
-                    return self.pages[page_id]
+                    return self._render_page(page_id)
                 
                 # For future pages not yet implemented, show placeholder
                 future_pages = {
@@ -73,6 +74,13 @@ class MainCallbacks:
                     html.P(f"Failed to render page content: {e}")
                 ])
     
+    def _render_page(self, page_id: str) -> Any:
+        """Build a page on its first visit and reuse the layout afterwards."""
+        layout = self._rendered_pages.get(page_id)
+        if layout is None:
+            layout = self._rendered_pages[page_id] = self.pages[page_id]()
+        return layout
+    
     def _register_active_link_callback(self, app) -> None:
         """Register callback to highlight active navigation link."""
         nav_items = ['sensors', 'driving', 'brakes', 'emergency', 'safety', 'profiles']
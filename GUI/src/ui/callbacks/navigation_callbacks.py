@@ -37,6 +37,8 @@ Handles callbacks for the navigation bar components including:
 
 import json
 import os
+import socket
+import subprocess
 import sys
 from pathlib import Path
 from typing import Dict, List, Any, Optional, Tuple
@@ -60,12 +62,53 @@ from services.tcp_communication_service import CommunicationService
 
 logger = get_logger(__name__)
 
+SERIAL_SERVER_TCP_PORT = 9999
+SERIAL_SERVER_START_TIMEOUT = 8.0  # Seconds; the server waits ~3s for the board reset before listening
+
+# Resolved from this file's location so the server module is never imported into the GUI process
+SRC_DIR = Path(__file__).resolve().parents[2]
+PROJECT_ROOT = SRC_DIR.parent
+SERIAL_SERVER_SCRIPT = SRC_DIR / "services" / "serial_server.py"
+
+# Platform checks resolved once at import
+IS_WINDOWS = os.name == "nt"
+SERIAL_SERVER_CREATIONFLAGS = subprocess.CREATE_NEW_PROCESS_GROUP if IS_WINDOWS else 0
+
+
+def _is_serial_server_listening(port: int = SERIAL_SERVER_TCP_PORT, timeout: float = 0.05) -> bool:
+    """Return True if something accepts TCP connections on the local serial server port."""
+    probe = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    probe.settimeout(timeout)
+    try:
+        probe.connect(('127.0.0.1', port))
+        return True
+    except OSError:
+        return False
+    finally:
+        probe.close()
+
+
+def _read_available_output(process, limit: int = 4096) -> str:
+    """Return whatever output a child process has written so far, without blocking."""
+    # os.set_blocking is unavailable for pipes on Windows before Python 3.12; skip the read there
+    if process.stdout is None or not hasattr(os, "set_blocking"):
+        return ""
+    try:
+        fd = process.stdout.fileno()
+        os.set_blocking(fd, False)
+        data = os.read(fd, limit)
+    except OSError:  # Includes BlockingIOError when nothing has been written yet
+        return ""
+    return data.decode("utf-8", errors="replace").strip()
+
 
 class NavigationBarCallbacks:
     """Handles navigation bar related callbacks."""
     
     def __init__(self):
         self.communication_service = None
+        self._server_process: Optional[subprocess.Popen] = None
+        self._server_args: Optional[Tuple[str, int]] = None  # (port, baud_rate) it was started with
         self._last_port_refresh = 0
         self._port_refresh_cooldown = 2.0  # Seconds
     
@@ -316,72 +359,86 @@ class NavigationBarCallbacks:
     def _ensure_serial_server_running(self, port: str, baud_rate: int) -> bool:
         """Ensure the serial server is running for the specified port and baud rate."""
         try:
-            import socket
-            import subprocess
-            import sys
-            from pathlib import Path
-            
             # Check if server is already running on port 9999
-            try:
-                test_socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-                result = test_socket.connect_ex(('localhost', 9999))
-                test_socket.close()
-                if result == 0:
-                    logger.info("Serial server already running on port 9999")
-                    return True
-            except:
-                pass
-            
-            logger.info(f"Starting serial server for {port} at {baud_rate} baud")
-            
-            # Path to the serial server script
-            from services.serial_server import __file__ as server_file
-            server_script = Path(server_file)
+            if _is_serial_server_listening():
+                logger.info("Serial server already running on port 9999")
+                return True
             
-            if not server_script.exists():
-                logger.error(f"Serial server script not found: {server_script}")
-                return False
+            # Reuse a server this process already spawned if it is still starting up
+            # for the same port and baud rate; otherwise replace it
+            process = self._server_process
+            if process is not None and process.poll() is None and self._server_args != (port, baud_rate):
+                logger.info(f"Stopping serial server (PID: {process.pid}) started for a different port/baud rate")
+                self._stop_server_process(process)
+                process = None
+            if process is not None and process.poll() is None:
+                logger.info(f"Serial server (PID: {process.pid}) still starting, waiting for it")
+            else:
+                logger.info(f"Starting serial server for {port} at {baud_rate} baud")
             
-            # Start the server process
-            cmd = [
-                sys.executable,
-                str(server_script),
-                "--port", port,
-                "--baudrate", str(baud_rate),
-                "--tcp-port", "9999"
-            ]
+                if not SERIAL_SERVER_SCRIPT.exists():
+                    logger.error(f"Serial server script not found: {SERIAL_SERVER_SCRIPT}")
+                    return False
             
-            logger.info(f"Starting server with command: {' '.join(cmd)}")
-            process = subprocess.Popen(
-                cmd,
-                cwd=server_script.parent.parent.parent,  # Navigate to project root
-                stdout=subprocess.PIPE,
-                stderr=subprocess.STDOUT,
-                universal_newlines=True,
-                creationflags=subprocess.CREATE_NEW_PROCESS_GROUP if os.name == "nt" else 0
-            )
+                # Start the server process
+                cmd = [
+                    sys.executable,
+                    str(SERIAL_SERVER_SCRIPT),
+                    "--port", port,
+                    "--baudrate", str(baud_rate),
+                    "--tcp-port", str(SERIAL_SERVER_TCP_PORT)
+                ]
             
-            # Give the server time to start
-            time.sleep(3)
+                logger.info(f"Starting server with command: {' '.join(cmd)}")
+                process = subprocess.Popen(
+                    cmd,
+                    cwd=PROJECT_ROOT,
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.STDOUT,
+                    universal_newlines=True,
+                    creationflags=SERIAL_SERVER_CREATIONFLAGS
+                )
+                self._server_process = process
+                self._server_args = (port, baud_rate)
             
-            # Check if server is now running
-            try:
-                test_socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-                result = test_socket.connect_ex(('localhost', 9999))
-                test_socket.close()
-                if result == 0:
-                    logger.info(f"Serial server successfully started (PID: {process.pid})")
-                    return True
-                else:
+            # Poll until the server listens, backing off, and stop early if it exits
+            deadline = time.monotonic() + SERIAL_SERVER_START_TIMEOUT
+            delay = 0.01
+            while not _is_serial_server_listening():
+                if process.poll() is not None:
+                    logger.error(f"Serial server exited during startup (code {process.returncode})")
+                    self._log_server_output(process)
+                    return False
+                if time.monotonic() >= deadline:
                     logger.error("Serial server failed to start - port 9999 not available")
+                    self._log_server_output(process)
                     return False
-            except Exception as e:
-                logger.error(f"Error checking server status: {e}")
-                return False
+                time.sleep(delay)
+                delay = min(delay * 2, 0.5)
+
+            logger.info(f"Serial server successfully started (PID: {process.pid})")
+            return True
                 
         except Exception as e:
             logger.error(f"Error starting serial server: {e}")
             return False
+
+    def _stop_server_process(self, process) -> None:
+        """Terminate a spawned serial server, killing it if it does not exit promptly."""
+        try:
+            process.terminate()
+            process.wait(timeout=2)
+        except subprocess.TimeoutExpired:
+            process.kill()
+            process.wait()
+        self._server_process = None
+        self._server_args = None
+
+    def _log_server_output(self, process) -> None:
+        """Log any startup diagnostics the serial server has printed so far."""
+        output = _read_available_output(process)
+        if output:
+            logger.error(f"Serial server output:\n{output}")
     
     def _clear_sensors_for_mode_switch(self) -> None:
         """Clear all sensors when switching communication modes."""
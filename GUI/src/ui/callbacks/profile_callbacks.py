@@ -1,10 +1,11 @@
 """VFD Profile-related callbacks."""
-from dash.dependencies import Input, Output, State
-from dash import html, callback_context
+from dash.dependencies import Input, Output, State, ALL
+from dash import html, ctx
 from dash.exceptions import PreventUpdate
 import dash
 import dash_bootstrap_components as dbc
 from datetime import datetime
+import json
 
 from core.dependencies import container
 from services.profile_service import ProfileService, ProfileType
@@ -12,65 +13,84 @@ from config.log_config import get_logger
 
 logger = get_logger(__name__)
 
+# Profile buttons share one pattern-matching id type; the index is the profile command
+PROFILE_BUTTON_TYPE = 'profile-button'
+PROFILES_BY_COMMAND = {profile.command: profile for profile in ProfileType}
+
+# Runs in the browser so the "executing" feedback appears without a server round-trip
+PROFILE_FEEDBACK_JS = """
+function() {
+    const triggered = dash_clientside.callback_context.triggered;
+    if (!triggered || !triggered.length || !triggered[0].value) {
+        throw dash_clientside.PreventUpdate;
+    }
+    const propId = triggered[0].prop_id;
+    const command = JSON.parse(propId.slice(0, propId.lastIndexOf('.'))).index;
+    const names = __PROFILE_NAMES__;
+    const name = names[command] || 'VFD profile';
+    return ['Executing ' + name + '...', true, 'info'];
+}
+""".replace('__PROFILE_NAMES__', json.dumps(
+    {profile.command: profile.display_name for profile in ProfileType}
+))
+
 
 class ProfileCallbacks:
     """VFD Profile callback manager."""
     
     def __init__(self):
-        pass
+        self.profile_service = None
     
     def register(self, app) -> None:
         """Register VFD profile-related callbacks."""
+        self._register_profile_feedback_callback(app)
         self._register_profile_button_callbacks(app)
         self._register_profile_status_callback(app)
     
+    def _register_profile_feedback_callback(self, app) -> None:
+        """Register the clientside callback that acknowledges a profile click instantly."""
+        app.clientside_callback(
+            PROFILE_FEEDBACK_JS,
+            [
+                Output('profile-output', 'children', allow_duplicate=True),
+                Output('profile-output', 'is_open', allow_duplicate=True),
+                Output('profile-output', 'color', allow_duplicate=True)
+            ],
+            Input({'type': PROFILE_BUTTON_TYPE, 'index': ALL}, 'n_clicks'),
+            prevent_initial_call=True
+        )
+    
     def _register_profile_button_callbacks(self, app) -> None:
         """Register VFD profile button callbacks."""
         @app.callback(
             [
-                Output('profile-output', 'children'),
-                Output('profile-output', 'is_open'),
-                Output('profile-output', 'color'),
+                Output('profile-output', 'children', allow_duplicate=True),
+                Output('profile-output', 'is_open', allow_duplicate=True),
+                Output('profile-output', 'color', allow_duplicate=True),
                 Output('current-profile-display', 'children'),
                 Output('last-execution-time', 'children'),
                 Output('profile-history-list', 'children')
             ],
-            [
-                Input('profile-sensors', 'n_clicks'),
-                Input('profile-communication', 'n_clicks'),
-                Input('profile-power', 'n_clicks'),
-                Input('profile-diagnostics', 'n_clicks'),
-                Input('profile-emergency', 'n_clicks')
-            ],
+            Input({'type': PROFILE_BUTTON_TYPE, 'index': ALL}, 'n_clicks'),
             prevent_initial_call=True
         )
-        def handle_profile_execution(sensors_clicks, comm_clicks, power_clicks,
-                                   diag_clicks, emergency_clicks):
+        def handle_profile_execution(n_clicks):
             """Handle VFD profile execution."""
+            # Buttons mounting with the profile page fire with every n_clicks unset
+            if ctx.triggered_id is None or not any(n_clicks):
+                raise PreventUpdate
+            
             try:
-                if not callback_context.triggered:
-                    raise PreventUpdate
-                
-                trigger_id = callback_context.triggered[0]['prop_id'].split('.')[0]
-                logger.info(f"VFD Profile execution triggered: {trigger_id}")
+                command = ctx.triggered_id['index']
+                logger.info("VFD Profile execution triggered: %s", command)
                 
-                # Map button IDs to profile types
-                profile_map = {
-                    'profile-sensors': ProfileType.SENSORS,
-                    'profile-communication': ProfileType.COMMUNICATION,
-                    'profile-power': ProfileType.POWER,
-                    'profile-diagnostics': ProfileType.DIAGNOSTICS,
-                    'profile-emergency': ProfileType.EMERGENCY
-                }
-                
-                if trigger_id not in profile_map:
-                    logger.warning(f"Unknown VFD profile trigger: {trigger_id}")
+                selected_profile = PROFILES_BY_COMMAND.get(command)
+                if selected_profile is None:
+                    logger.warning("Unknown VFD profile trigger: %s", command)
                     return "Unknown profile selected", True, "warning", "None", "--", []
                 
-                selected_profile = profile_map[trigger_id]
-                
                 # Get profile service
-                profile_service = container.get(ProfileService)
+                profile_service = self._get_profile_service()
                 
                 # Execute the profile
                 logger.info(f"Executing VFD profile: {selected_profile.display_name}")
@@ -125,7 +145,7 @@ class ProfileCallbacks:
         def update_profile_status_card(current_profile):
             """Update the VFD profile status card."""
             try:
-                profile_service = container.get(ProfileService)
+                profile_service = self._get_profile_service()
                 status = profile_service.get_current_status()
                 
                 return [
@@ -178,6 +198,12 @@ class ProfileCallbacks:
                     ], className="p-3")
                 ]
     
+    def _get_profile_service(self) -> ProfileService:
+        """Get the profile service instance, resolving it from the container once."""
+        if self.profile_service is None:
+            self.profile_service = container.get(ProfileService)
+        return self.profile_service
+    
     def _get_history_items(self, profile_service: ProfileService) -> list:
         """Get VFD profile history items for display."""
         try:
@@ -8,6 +8,8 @@ import dash_bootstrap_components as dbc
 import datetime
 import numpy as np
 import json
+import itertools
+from functools import lru_cache
 
 from core.dependencies import container
 from services.sensor_service import SensorService
@@ -20,12 +22,88 @@ from config.log_config import get_logger
 
 logger = get_logger(__name__)
 
+# Synthetic preview series: 30 points per field
+PREVIEW_POINTS = 30
+
+# Noise is drawn once into fixed pools; each series takes the next window.
+# The pool size is a power of two so the cursor wraps with a mask.
+NOISE_POOL_SIZE = 16384
+_RNG = np.random.default_rng()
+_NORMAL_POOL = _RNG.standard_normal(NOISE_POOL_SIZE + PREVIEW_POINTS)
+_UNIFORM_POOL = _RNG.random(NOISE_POOL_SIZE + PREVIEW_POINTS)
+_pool_cursor = itertools.count(0, PREVIEW_POINTS)
+
+
+def _pool_window(pool: np.ndarray) -> np.ndarray:
+    """Next PREVIEW_POINTS-long window of a pre-drawn noise pool."""
+    start = next(_pool_cursor) & (NOISE_POOL_SIZE - 1)
+    return pool[start:start + PREVIEW_POINTS]
+
+
+def _sine_generator(offset: float, amplitude: float, half_cycles: int, noise: float,
+                    clip=None, rectify: bool = False):
+    """Build a generator for ``offset + amplitude * sin(...)`` plus Gaussian noise.
+    
+    The deterministic part is computed once; each call only adds pooled noise.
+    """
+    wave = np.sin(np.linspace(0, half_cycles * np.pi, PREVIEW_POINTS))
+    base = offset + amplitude * (np.abs(wave) if rectify else wave)
+    
+    def generate() -> np.ndarray:
+        values = base + noise * _pool_window(_NORMAL_POOL)
+        return np.clip(values, *clip) if clip else values
+    return generate
+
+
+def _binary_generator(p_high: float, noise: float = 0.0):
+    """Build a generator for 0/1 states, optionally with Gaussian noise."""
+    def generate() -> np.ndarray:
+        values = (_pool_window(_UNIFORM_POOL) < p_high).astype(np.float64)
+        return values + noise * _pool_window(_NORMAL_POOL) if noise else values
+    return generate
+
+
+def _gps_generator() -> np.ndarray:
+    """Small random walk simulating GPS coordinate drift."""
+    return np.cumsum(0.001 * _pool_window(_NORMAL_POOL))
+
+
+def _field_generator_table():
+    """Map lower-cased field names to their preview generators."""
+    groups = (
+        (('distance', 'range'), _sine_generator(15, 8, 3, 0.3, clip=(2, 30))),
+        (('temperature', 'temp'), _sine_generator(25, 5, 2, 0.5)),
+        (('pressure',), _sine_generator(1005, 10, 1, 1)),
+        (('acceleration', 'accel', 'x', 'y', 'z'), _sine_generator(0, 0.5, 4, 0.1)),
+        (('vibration', 'amplitude'), _sine_generator(2, 1.5, 6, 0.2, clip=(0, 5), rectify=True)),
+        (('line', 'detection'), _binary_generator(0.3, noise=0.1)),
+        (('proximity',), _sine_generator(5, 3, 2, 0.3, clip=(0, 10))),
+        (('angle', 'position'), _sine_generator(90, 45, 1, 2, clip=(0, 180))),
+        (('state', 'relay', 'switch'), _binary_generator(0.4)),
+        (('latitude', 'longitude', 'lat', 'lon'), _gps_generator),
+    )
+    return {name: generator for names, generator in groups for name in names}
+
+
+_FIELD_GENERATORS = _field_generator_table()
+_GENERIC_GENERATOR = _sine_generator(50, 20, 2, 2)
+
+# Graph component id templates, bound once rather than re-parsed per render
+FIELD_GRAPH_ID = '{}-{}-graph'.format
+SENSOR_GRAPH_ID = '{}-graph'.format
+
+
+@lru_cache(maxsize=None)
+def _graph_slug(sensor_name: str) -> str:
+    """Id-safe form of a sensor name, e.g. 'GPS Sensor' -> 'gps-sensor'."""
+    return sensor_name.replace(' ', '-').lower()
+
 
 class SensorCallbacks:
     """Sensor callback manager."""
     
     def __init__(self):
-        pass
+        self.tcp_service = None
     
     def register(self, app) -> None:
         """Register sensor-related callbacks."""
@@ -47,8 +125,7 @@ class SensorCallbacks:
                 logger.info(f"Callback triggered: interval={n_intervals}, sensors={selected_sensors}, refresh={refresh_trigger}")
                 
                 # Get TCP communication service directly
-                from services.tcp_communication_service import CommunicationService
-                tcp_service = container.get(CommunicationService)
+                tcp_service = self._get_tcp_service()
                 
                 if not selected_sensors:
                     logger.warning("No sensors selected")
@@ -58,14 +135,12 @@ class SensorCallbacks:
                 sensor_cards = []
                 active_count = 0
                 
+                from sensors.sensor_registry import get_registry
+                get_sensor_id = get_registry().get_sensor_id_by_name
+                
                 for sensor_name in selected_sensors:
                     # Find the sensor ID that corresponds to this sensor name
-                    from sensors.sensor_registry import sensor_registry
-                    sensor_id = None
-                    for sid, info in sensor_registry.sensor_classes.items():
-                        if info['name'] == sensor_name:
-                            sensor_id = sid
-                            break
+                    sensor_id = get_sensor_id(sensor_name)
                     
                     if not sensor_id:
                         logger.warning(f"Could not find sensor ID for sensor name: {sensor_name}")
@@ -175,8 +250,8 @@ class SensorCallbacks:
         """Create a sensor card with proper graphs using actual sensor data fields."""
         
         # Get sensor information from registry
-        from sensors.sensor_registry import sensor_registry
-        sensor_info = sensor_registry.get_sensor_info(sensor_id)
+        from sensors.sensor_registry import get_registry
+        sensor_info = get_registry().get_sensor_info(sensor_id)
         
         if not sensor_info:
             # Fallback to single graph if sensor info not found
@@ -195,7 +270,7 @@ class SensorCallbacks:
                 graphs.append(
                     html.Div([
                         dcc.Graph(
-                            id=f"{sensor_name.replace(' ', '-').lower()}-{field}-graph",
+                            id=FIELD_GRAPH_ID(_graph_slug(sensor_name), field),
                             figure=fig,
                             style={'height': '300px', 'width': '100%'}
                         )
@@ -209,7 +284,7 @@ class SensorCallbacks:
                 graphs.append(
                     html.Div([
                         dcc.Graph(
-                            id=f"{sensor_name.replace(' ', '-').lower()}-{field}-graph",
+                            id=FIELD_GRAPH_ID(_graph_slug(sensor_name), field),
                             figure=fig,
                             style={'height': '300px', 'width': '100%'}
                         )
@@ -223,7 +298,7 @@ class SensorCallbacks:
             graphs = [
                 html.Div([
                     dcc.Graph(
-                        id=f"{sensor_name.replace(' ', '-').lower()}-graph",
+                        id=SENSOR_GRAPH_ID(_graph_slug(sensor_name)),
                         figure=fig,
                         style={'height': '300px', 'width': '100%'}
                     )
@@ -470,7 +545,7 @@ class SensorCallbacks:
             ]),
             dbc.CardBody([
                 dcc.Graph(
-                    id=f"{sensor_name.replace(' ', '-').lower()}-graph",
+                    id=SENSOR_GRAPH_ID(_graph_slug(sensor_name)),
                     figure=fig,
                     style={'height': '300px', 'width': '100%'}
                 ),
@@ -645,49 +720,7 @@ class SensorCallbacks:
     
     def _generate_field_data(self, field: str, sensor_name: str, sensor_id: str) -> np.ndarray:
         """Generate realistic data for a specific field."""
-        # Generate 30 data points
-        if field.lower() in ['distance', 'range']:
-            # Distance data (5-25 cm for ultrasonic, etc.)
-            values = 15 + 8 * np.sin(np.linspace(0, 3*np.pi, 30)) + np.random.normal(0, 0.3, 30)
-            return np.clip(values, 2, 30)
-        elif field.lower() in ['temperature', 'temp']:
-            # Temperature data (20-35�C)
-            values = 25 + 5 * np.sin(np.linspace(0, 2*np.pi, 30)) + np.random.normal(0, 0.5, 30)
-            return values
-        elif field.lower() in ['pressure']:
-            # Pressure data (990-1020 hPa)
-            values = 1005 + 10 * np.sin(np.linspace(0, np.pi, 30)) + np.random.normal(0, 1, 30)
-            return values
-        elif field.lower() in ['acceleration', 'accel', 'x', 'y', 'z']:
-            # Acceleration data (-2 to 2 g)
-            values = 0.5 * np.sin(np.linspace(0, 4*np.pi, 30)) + np.random.normal(0, 0.1, 30)
-            return values
-        elif field.lower() in ['vibration', 'amplitude']:
-            # Vibration amplitude (0-5)
-            values = 2 + 1.5 * np.abs(np.sin(np.linspace(0, 6*np.pi, 30))) + np.random.normal(0, 0.2, 30)
-            return np.clip(values, 0, 5)
-        elif field.lower() in ['line', 'detection']:
-            # Line sensor (0-1 binary + noise)
-            base_values = np.random.choice([0, 1], 30, p=[0.7, 0.3])
-            return base_values + np.random.normal(0, 0.1, 30)
-        elif field.lower() in ['proximity']:
-            # Proximity sensor (0-10)
-            values = 5 + 3 * np.sin(np.linspace(0, 2*np.pi, 30)) + np.random.normal(0, 0.3, 30)
-            return np.clip(values, 0, 10)
-        elif field.lower() in ['angle', 'position']:
-            # Servo angle (0-180 degrees)
-            values = 90 + 45 * np.sin(np.linspace(0, np.pi, 30)) + np.random.normal(0, 2, 30)
-            return np.clip(values, 0, 180)
-        elif field.lower() in ['state', 'relay', 'switch']:
-            # Relay state (0-1)
-            return np.random.choice([0, 1], 30, p=[0.6, 0.4])
-        elif field.lower() in ['latitude', 'longitude', 'lat', 'lon']:
-            # GPS coordinate change (simulate small movements)
-            return np.cumsum(np.random.normal(0, 0.001, 30))
-        else:
-            # Default generic data
-            values = 50 + 20 * np.sin(np.linspace(0, 2*np.pi, 30)) + np.random.normal(0, 2, 30)
-            return values
+        return _FIELD_GENERATORS.get(field.lower(), _GENERIC_GENERATOR)()
     
     def _get_field_color(self, field: str) -> str:
         """Get appropriate color for a data field."""
@@ -721,6 +754,13 @@ class SensorCallbacks:
         else:
             return '#495057'  # Dark gray default
     
+    def _get_tcp_service(self):
+        """Get the shared TCP communication service, resolving it from the container once."""
+        if self.tcp_service is None:
+            from services.tcp_communication_service import CommunicationService
+            self.tcp_service = container.get(CommunicationService)
+        return self.tcp_service
+    
     def _register_tcp_console_callback(self, app) -> None:
         """Register TCP console output update callback."""
         @app.callback(
@@ -732,8 +772,7 @@ class SensorCallbacks:
             """Update TCP console with recent communication messages."""
             try:
                 # Get TCP communication service
-                from services.tcp_communication_service import CommunicationService
-                tcp_service = container.get(CommunicationService)
+                tcp_service = self._get_tcp_service()
                 
                 # Get recent console messages
                 messages = tcp_service.get_console_messages(n=50)
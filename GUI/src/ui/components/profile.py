@@ -9,6 +9,15 @@ from config.log_config import get_logger
 
 logger = get_logger(__name__)
 
+# Bootstrap color used for each profile's button and icon
+PROFILE_COLORS = {
+    ProfileType.SENSORS: "primary",
+    ProfileType.COMMUNICATION: "info",
+    ProfileType.POWER: "warning",
+    ProfileType.DIAGNOSTICS: "success",
+    ProfileType.EMERGENCY: "danger"
+}
+
 
 class ProfileButton:
     """VFD Profile button component."""
@@ -18,21 +27,13 @@ class ProfileButton:
     
     def create(self) -> dbc.Button:
         """Create a VFD profile button."""
-        color_map = {
-            ProfileType.SENSORS: "primary",
-            ProfileType.COMMUNICATION: "info",
-            ProfileType.POWER: "warning",
-            ProfileType.DIAGNOSTICS: "success",
-            ProfileType.EMERGENCY: "danger"
-        }
-        
         return dbc.Button(
             [
                 html.I(className=f"{self.profile.icon} me-2"),
                 self.profile.display_name
             ],
-            id=f"profile-{self.profile.command}",
-            color=color_map.get(self.profile, "secondary"),
+            id={"type": "profile-button", "index": self.profile.command},
+            color=PROFILE_COLORS.get(self.profile, "secondary"),
             className="mb-2",
             style={"width": "100%"},
             size="lg"
@@ -47,18 +48,10 @@ class ProfileSelector:
     
     def create_profile_card(self, profile: ProfileType) -> dbc.Card:
         """Create a VFD profile card."""
-        color_map = {
-            ProfileType.SENSORS: "primary",
-            ProfileType.COMMUNICATION: "info", 
-            ProfileType.POWER: "warning",
-            ProfileType.DIAGNOSTICS: "success",
-            ProfileType.EMERGENCY: "danger"
-        }
-        
         return dbc.Card([
             dbc.CardBody([
                 html.Div([
-                    html.I(className=f"{profile.icon} fa-2x mb-3 text-{color_map.get(profile, 'secondary')}")
+                    html.I(className=f"{profile.icon} fa-2x mb-3 text-{PROFILE_COLORS.get(profile, 'secondary')}")
                 ], className="text-center"),
                 html.H5(profile.display_name, className="card-title text-center mb-2"),
                 html.P(profile.description, className="text-muted text-center small mb-3"),
@@ -67,8 +60,8 @@ class ProfileSelector:
                         html.I(className="fas fa-play me-2"),
                         "Execute Profile"
                     ],
-                    id=f"profile-{profile.command}",
-                    color=color_map.get(profile, "secondary"),
+                    id={"type": "profile-button", "index": profile.command},
+                    color=PROFILE_COLORS.get(profile, "secondary"),
                     className="w-100",
                     size="lg"
                 )
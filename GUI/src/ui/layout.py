@@ -1,7 +1,7 @@
 """Main application layout."""
 from dash import html, dcc
 import dash_bootstrap_components as dbc
-from typing import Optional, List, Dict
+from typing import Any, Callable, Optional, List, Dict
 
 from ui.components.common import NavigationBar, Sidebar, CallbackStore
 from ui.pages.sensor_page import SensorDashboardPage
@@ -9,7 +9,7 @@ from ui.pages.profile_page import ProfilePage
 from core.dependencies import container
 from services.sensor_service import SensorService
 from services.profile_service import ProfileService
-from sensors.sensor_registry import sensor_registry
+from sensors.sensor_registry import get_registry
 from config.log_config import get_logger
 
 logger = get_logger(__name__)
@@ -32,18 +32,15 @@ class MainLayout:
     def __init__(self):
         self.navbar = NavigationBar()
         self.sidebar = Sidebar()
-        self.pages: Dict[str, any] = {}
+        # Page builders; each page is only rendered when first visited
+        self.pages: Dict[str, Callable[[], Any]] = {}
         self._setup_pages()
     
     def _setup_pages(self) -> None:
         """Setup application pages and navigation."""
         try:
-            # Get sensor names from registry instead of sensor service
-            sensor_names = sensor_registry.get_all_sensor_names()
-            sensor_page = SensorDashboardPage(sensor_names)
-            
-            # Add sensor page
-            self.pages['sensors'] = sensor_page.create_layout()
+            # Add sensor page (sensor names come from the registry instead of the sensor service)
+            self.pages['sensors'] = self._create_sensor_page
             self.sidebar.add_nav_item('sensors', 'Sensor Dashboard', 'fas fa-tachometer-alt')
             
             # Add navigation items for future features (will be implemented as overlays or pages later)
@@ -54,8 +51,7 @@ class MainLayout:
             self.sidebar.add_nav_item('safety', 'Safety Verification', 'fas fa-shield-alt')
 
             # Add profile page for VFD operational modes
-            profile_page = ProfilePage()
-            self.pages['profiles'] = profile_page.create_layout()
+            self.pages['profiles'] = ProfilePage().create_layout
             self.sidebar.add_nav_item('profiles', 'VFD Profiles', 'fas fa-rocket')
             
             # Set default page
@@ -66,12 +62,18 @@ class MainLayout:
         except Exception as e:
             logger.error(f"Failed to setup pages: {e}")
             # Create minimal fallback layout
-            self.pages['error'] = html.Div([
+            error_layout = html.Div([
                 html.H3("Application Error"),
                 html.P(f"Failed to initialize application: {e}")
             ])
+            self.pages['error'] = lambda: error_layout
             self.default_page = 'error'
     
+    def _create_sensor_page(self) -> html.Div:
+        """Build the sensor dashboard page."""
+        sensor_names = get_registry().get_all_sensor_names()
+        return SensorDashboardPage(sensor_names).create_layout()
+    
     def create_layout(self) -> html.Div:
         """Create the main application layout."""
         try:
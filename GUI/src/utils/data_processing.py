@@ -1,4 +1,6 @@
 """Data processing utilities."""
+import re
+import numpy as np
 import pandas as pd
 from datetime import datetime, timedelta
 from typing import List, Dict, Any, Optional
@@ -10,8 +12,17 @@ from config.log_config import get_logger
 
 logger = get_logger(__name__)
 
+# Samples older than this are dropped by clean_sensor_data
+DEFAULT_MAX_AGE_SECONDS = 300
 
-def clean_sensor_data(data: pd.DataFrame, max_age_seconds: int = 300) -> pd.DataFrame:
+# Serial header lines: *H*_sensorName_pinList_payload
+HEADER_PATTERN = re.compile(r'\*H\*_([^_]*)_([^_]*)_(.*)')
+
+# First signed decimal number in a labelled value such as "25.5C"
+NUMBER_PATTERN = re.compile(r'[+-]?(?:\d+(?:\.\d*)?|\.\d+)')
+
+
+def clean_sensor_data(data: pd.DataFrame, max_age_seconds: int = DEFAULT_MAX_AGE_SECONDS) -> pd.DataFrame:
     """Clean sensor data by removing old entries and invalid values."""
     if data.empty:
         return data
@@ -97,3 +108,11 @@ def validate_sensor_data(data: Dict[str, Any]) -> bool:
     except Exception as e:
         logger.error(f"Error validating sensor data: {e}")
         return False
+
+
+def validate_sensor_data_vec(values: np.ndarray) -> np.ndarray:
+    """Validate a batch of samples shaped (n_samples, n_fields) in one pass.
+    
+    Returns a boolean mask that is True for rows containing only finite values.
+    """
+    return np.isfinite(values).all(axis=1)
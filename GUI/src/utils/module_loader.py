@@ -24,21 +24,32 @@ def load_modules_from_directory(
     modules = []
     
     try:
-        if not os.path.exists(directory_path):
+        # A missing directory surfaces from listdir itself; no separate exists() probe
+        try:
+            filenames = os.listdir(directory_path)
+        except FileNotFoundError:
             logger.warning(f"Directory does not exist: {directory_path}")
             return modules
         
         # Get the relative path for imports
         relative_path = os.path.relpath(directory_path).replace(os.sep, '.')
         
-        for filename in os.listdir(directory_path):
+        for filename in filenames:
             if not filename.endswith(file_suffix) or filename in exclude_files:
                 continue
             
             module_name = f"{relative_path}.{filename[:-3]}"
             
             try:
-                module = importlib.import_module(module_name)
+                try:
+                    module = importlib.import_module(module_name)
+                except ModuleNotFoundError as e:
+                    # Only the module itself being absent is skippable; a missing
+                    # dependency inside it is a real error, handled below
+                    if e.name != module_name:
+                        raise
+                    logger.warning(f"Module {module_name} could not be imported: {e}")
+                    continue
                 
                 # Look for classes that inherit from base_class
                 for attr_name in dir(module):
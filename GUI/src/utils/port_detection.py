@@ -6,10 +6,13 @@ Used by the GUI navigation bar and communication services.
 """
 
 import os
+import re
 import sys
 from pathlib import Path
 from typing import List, Dict, Tuple, Optional
 import time
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 # Use PYTHONPATH for imports
 from config.log_config import get_logger
@@ -56,24 +59,40 @@ class PortDetector:
     """Utility class for detecting serial ports and microcontrollers."""
     
     # Common microcontroller identifiers
-    MICROCONTROLLER_KEYWORDS = [
+    MICROCONTROLLER_KEYWORDS = (
         'arduino', 'esp32', 'esp8266', 'teensy', 'micro', 'uno', 'nano',
         'leonardo', 'mega', 'pro', 'usb serial', 'ch340', 'ftdi', 'cp210',
         'cp2102', 'cp2104', 'pl2303', 'silicon labs', 'prolific'
-    ]
+    )
+    MICROCONTROLLER_PATTERN = re.compile(
+        '|'.join(map(re.escape, MICROCONTROLLER_KEYWORDS)), re.IGNORECASE
+    )
     
     # Common baud rates for microcontrollers
     STANDARD_BAUD_RATES = [
         9600, 19200, 38400, 57600, 115200, 230400, 460800, 921600
     ]
     
+    # Port enumeration can block for seconds on some systems; reuse a recent scan
+    PORT_CACHE_TTL = 2.0  # Seconds
+    _port_cache: Optional[Tuple[float, List[PortInfo]]] = None
+    
     @classmethod
-    def get_available_ports(cls) -> List[PortInfo]:
-        """Get all available serial ports."""
+    def get_available_ports(cls, use_cache: bool = True) -> List[PortInfo]:
+        """Get all available serial ports.
+        
+        Args:
+            use_cache: Reuse a scan made within the last PORT_CACHE_TTL seconds
+        """
         if not PYSERIAL_AVAILABLE:
             logger.warning("PySerial not available - returning empty port list")
             return []
         
+        now = time.monotonic()
+        cached = cls._port_cache
+        if use_cache and cached is not None and now - cached[0] < cls.PORT_CACHE_TTL:
+            return list(cached[1])
+        
         try:
             ports = []
             for port in serial.tools.list_ports.comports():
@@ -97,7 +116,8 @@ class PortDetector:
             
             # Sort ports - microcontrollers first, then by device name
             ports.sort(key=lambda p: (not p.is_microcontroller, p.device))
-            return ports
+            cls._port_cache = (now, ports)
+            return list(ports)
             
         except Exception as e:
             logger.error(f"Error detecting serial ports: {e}")
@@ -112,14 +132,12 @@ class PortDetector:
     @classmethod
     def _is_microcontroller_port(cls, port) -> bool:
         """Determine if a port appears to be a microcontroller."""
-        # Combine description and manufacturer for searching
-        search_text = (
-            (port.description or "") + " " + 
-            (port.manufacturer or "")
-        ).lower()
-        
-        # Check for microcontroller keywords
-        return any(keyword in search_text for keyword in cls.MICROCONTROLLER_KEYWORDS)
+        # One case-insensitive regex pass over description, then manufacturer
+        search = cls.MICROCONTROLLER_PATTERN.search
+        return bool(
+            (port.description and search(port.description)) or
+            (port.manufacturer and search(port.manufacturer))
+        )
     
     @classmethod
     def test_port_connection(cls, device: str, baudrate: int = 115200, timeout: float = 2.0) -> bool:
@@ -147,7 +165,11 @@ class PortDetector:
         """Get port options formatted for Dash dropdown."""
         options = []
         
-        microcontroller_ports = cls.get_microcontroller_ports()
+        # Enumerate once and split, rather than scanning the ports twice
+        all_ports = cls.get_available_ports()
+        microcontroller_ports = [port for port in all_ports if port.is_microcontroller]
+        other_ports = [port for port in all_ports if not port.is_microcontroller]
+        
         if microcontroller_ports:
             # Add separator
             options.append({'label': '--- Microcontrollers ---', 'value': 'separator', 'disabled': True})
@@ -160,9 +182,6 @@ class PortDetector:
                 })
         
         # Add all ports section if there are non-microcontroller ports
-        all_ports = cls.get_available_ports()
-        other_ports = [port for port in all_ports if not port.is_microcontroller]
-        
         if other_ports:
             options.append({'label': '--- All Serial Ports ---', 'value': 'separator2', 'disabled': True})
             for port in other_ports:
@@ -187,6 +206,19 @@ class PortDetector:
         
         return options
     
+    @classmethod
+    def _probe_baud_rate(cls, device: str, found: Optional[threading.Event] = None) -> Optional[int]:
+        """Return the first common baud rate the port opens at, or None.
+        
+        Gives up before the next open once ``found`` is set by another probe.
+        """
+        for baud_rate in (115200, 9600, 57600):  # Most common rates first
+            if found is not None and found.is_set():
+                return None
+            if cls.test_port_connection(device, baud_rate):
+                return baud_rate
+        return None
+    
     @classmethod
     def auto_detect_microcontroller(cls) -> Optional[Tuple[str, int]]:
         """Auto-detect the best microcontroller port and suggested baud rate."""
@@ -196,12 +228,23 @@ class PortDetector:
             logger.info("No microcontroller ports detected")
             return None
         
-        # Try each microcontroller port with common baud rates
-        for port in microcontroller_ports:
-            for baud_rate in [115200, 9600, 57600]:  # Most common rates first
-                if cls.test_port_connection(port.device, baud_rate):
-                    logger.info(f"Auto-detected microcontroller: {port.device} at {baud_rate} baud")
-                    return port.device, baud_rate
+        # Probe the ports concurrently (each open can block) and stop at the first
+        # board that responds, so other ports are not opened and reset needlessly
+        found = threading.Event()
+        with ThreadPoolExecutor(max_workers=min(8, len(microcontroller_ports))) as executor:
+            futures = {
+                executor.submit(cls._probe_baud_rate, port.device, found): port.device
+                for port in microcontroller_ports
+            }
+            for future in as_completed(futures):
+                baud_rate = future.result()
+                if baud_rate is not None:
+                    found.set()
+                    for pending in futures:
+                        pending.cancel()
+                    device = futures[future]
+                    logger.info(f"Auto-detected microcontroller: {device} at {baud_rate} baud")
+                    return device, baud_rate
         
         # If no connection test succeeded, return first port with default baud
         first_port = microcontroller_ports[0]
@@ -212,7 +255,7 @@ class PortDetector:
     def refresh_port_list(cls) -> List[PortInfo]:
         """Refresh and return the current list of available ports."""
         logger.info("Refreshing serial port list")
-        return cls.get_available_ports()
+        return cls.get_available_ports(use_cache=False)
 
 
 # Convenience functions for common operations
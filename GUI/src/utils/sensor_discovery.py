@@ -11,15 +11,66 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+# Electrical workspace root (utils -> src -> GUI -> electrical), resolved once at import
+WORKSPACE_ROOT = Path(__file__).resolve().parents[3]
+
+
+def _list_sensor_dirs(path: Path) -> List[os.DirEntry]:
+    """Return the sensor sub-directories of ``path`` from a single scandir pass.
+
+    A missing directory yields an empty list, so callers need no separate exists() probe.
+    """
+    try:
+        with os.scandir(path) as entries:
+            return [entry for entry in entries
+                    if entry.name != "__pycache__" and entry.is_dir()]
+    except FileNotFoundError:
+        return []
+
+
+# Name keyword -> sensor type, checked in order (first substring match wins)
+SENSOR_TYPE_KEYWORDS = (
+    ('accelerometer', 'motion'),
+    ('pressure', 'environmental'),
+    ('thermistor', 'environmental'),
+    ('ultrasonic', 'distance'),
+    ('line_sensor', 'optical'),
+    ('proximity_sensor', 'distance'),
+    ('servo', 'actuator'),
+    ('vibration', 'motion'),
+    ('relay', 'control'),
+    ('nrf24l01', 'communication'),
+    ('transmitter-receiver', 'communication'),
+    ('vn-100', 'navigation'),
+    ('inductproxsensor', 'distance'),
+)
+
+# Name keyword -> default pins based on typical usage, checked in order
+DEFAULT_PIN_KEYWORDS = (
+    ('accelerometer', ('A1', 'D2', 'D3')),  # I2C typically
+    ('pressure', ('A2',)),  # Analog pressure sensor
+    ('thermistor', ('A0',)),  # Analog temperature
+    ('ultrasonic', ('D7', 'D8')),  # Trigger and echo pins
+    ('line_sensor', ('A0',)),  # Analog line detection
+    ('proximity_sensor', ('A0',)),  # Analog proximity
+    ('servo', ('D9',)),  # PWM pin
+    ('vibration', ('D2',)),  # Digital interrupt
+    ('relay', ('D4',)),  # Digital control
+    ('nrf24l01', ('D10', 'D9', 'D2')),  # SPI pins
+    ('transmitter-receiver', ('D0', 'D1')),  # Serial pins
+    ('vn-100', ('D0', 'D1')),  # Serial communication
+    ('inductproxsensor', ('A3',)),  # Analog inductive sensor
+    ('sensor', ('A0',)),  # Generic analog
+)
+
+
 class SensorDiscovery:
     """Discovers available sensors from the electrical workspace"""
     
     def __init__(self, base_path: str = None):
         if base_path is None:
             # Default to the electrical workspace root
-            current_file = Path(__file__).resolve()
-            gui_dir = current_file.parent.parent.parent  # Back to GUI root
-            self.base_path = gui_dir.parent  # Back to electrical root
+            self.base_path = WORKSPACE_ROOT
         else:
             self.base_path = Path(base_path)
         
@@ -34,13 +85,11 @@ class SensorDiscovery:
         
         # Scan depreciated/Sensors directory
         depreciated_sensors_path = self.base_path / "depreciated" / "Sensors"
-        if depreciated_sensors_path.exists():
-            sensors.extend(self._scan_depreciated_sensors(depreciated_sensors_path))
+        sensors.extend(self._scan_depreciated_sensors(depreciated_sensors_path))
         
         # Scan archived_resources/Workshop directory  
         workshop_path = self.base_path / "archived_resources" / "Workshop"
-        if workshop_path.exists():
-            sensors.extend(self._scan_workshop_sensors(workshop_path))
+        sensors.extend(self._scan_workshop_sensors(workshop_path))
         
         logger.info(f"Discovered {len(sensors)} sensors total")
         return sensors
@@ -49,17 +98,16 @@ class SensorDiscovery:
         """Scan depreciated/Sensors directory for sensor folders"""
         sensors = []
         
-        for item in sensors_path.iterdir():
-            if item.is_dir() and item.name != "__pycache__":
-                sensor_info = {
-                    'name': item.name.lower(),
-                    'type': self._infer_sensor_type(item.name),
-                    'source': 'depreciated/Sensors',
-                    'path': str(item),
-                    'pins': self._get_default_pins(item.name.lower())
-                }
-                sensors.append(sensor_info)
-                logger.debug(f"Found sensor: {sensor_info['name']} in {sensor_info['source']}")
+        for item in _list_sensor_dirs(sensors_path):
+            sensor_info = {
+                'name': item.name.lower(),
+                'type': self._infer_sensor_type(item.name),
+                'source': 'depreciated/Sensors',
+                'path': item.path,
+                'pins': self._get_default_pins(item.name.lower())
+            }
+            sensors.append(sensor_info)
+            logger.debug(f"Found sensor: {sensor_info['name']} in {sensor_info['source']}")
         
         return sensors
     
@@ -67,17 +115,16 @@ class SensorDiscovery:
         """Scan archived_resources/Workshop directory for sensor folders"""
         sensors = []
         
-        for item in workshop_path.iterdir():
-            if item.is_dir() and item.name != "__pycache__":
-                sensor_info = {
-                    'name': item.name.lower(),
-                    'type': self._infer_sensor_type(item.name),
-                    'source': 'archived_resources/Workshop',
-                    'path': str(item),
-                    'pins': self._get_default_pins(item.name.lower())
-                }
-                sensors.append(sensor_info)
-                logger.debug(f"Found sensor: {sensor_info['name']} in {sensor_info['source']}")
+        for item in _list_sensor_dirs(workshop_path):
+            sensor_info = {
+                'name': item.name.lower(),
+                'type': self._infer_sensor_type(item.name),
+                'source': 'archived_resources/Workshop',
+                'path': item.path,
+                'pins': self._get_default_pins(item.name.lower())
+            }
+            sensors.append(sensor_info)
+            logger.debug(f"Found sensor: {sensor_info['name']} in {sensor_info['source']}")
         
         return sensors
     
@@ -85,24 +132,7 @@ class SensorDiscovery:
         """Infer the type of sensor based on its name"""
         name_lower = sensor_name.lower()
         
-        # Map sensor names to types
-        type_mapping = {
-            'accelerometer': 'motion',
-            'pressure': 'environmental', 
-            'thermistor': 'environmental',
-            'ultrasonic': 'distance',
-            'line_sensor': 'optical',
-            'proximity_sensor': 'distance',
-            'servo': 'actuator',
-            'vibration': 'motion',
-            'relay': 'control',
-            'nrf24l01': 'communication',
-            'transmitter-receiver': 'communication',
-            'vn-100': 'navigation',
-            'inductproxsensor': 'distance'
-        }
-        
-        for key, sensor_type in type_mapping.items():
+        for key, sensor_type in SENSOR_TYPE_KEYWORDS:
             if key in name_lower:
                 return sensor_type
         
@@ -110,28 +140,9 @@ class SensorDiscovery:
     
     def _get_default_pins(self, sensor_name: str) -> List[str]:
         """Get default pin assignments for different sensor types"""
-        
-        # Pin mapping based on typical usage patterns
-        pin_mapping = {
-            'accelerometer': ['A1', 'D2', 'D3'],  # I2C typically
-            'pressure': ['A2'],  # Analog pressure sensor
-            'thermistor': ['A0'],  # Analog temperature
-            'ultrasonic': ['D7', 'D8'],  # Trigger and echo pins
-            'line_sensor': ['A0'],  # Analog line detection
-            'proximity_sensor': ['A0'],  # Analog proximity
-            'servo': ['D9'],  # PWM pin
-            'vibration': ['D2'],  # Digital interrupt
-            'relay': ['D4'],  # Digital control
-            'nrf24l01': ['D10', 'D9', 'D2'],  # SPI pins
-            'transmitter-receiver': ['D0', 'D1'],  # Serial pins
-            'vn-100': ['D0', 'D1'],  # Serial communication
-            'inductproxsensor': ['A3'],  # Analog inductive sensor
-            'sensor': ['A0']  # Generic analog
-        }
-        
-        for key, pins in pin_mapping.items():
+        for key, pins in DEFAULT_PIN_KEYWORDS:
             if key in sensor_name:
-                return pins
+                return list(pins)
         
         return ['A0']  # Default to analog pin
     